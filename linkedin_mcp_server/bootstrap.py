@@ -11,9 +11,8 @@ import os
 from pathlib import Path
 import shutil
 import sys
-from typing import NoReturn
-
-from fastmcp import Context
+import time
+from typing import TYPE_CHECKING, NoReturn
 
 from linkedin_mcp_server.authentication import get_authentication_source
 from linkedin_mcp_server.common_utils import secure_mkdir, secure_write_text, utcnow_iso
@@ -26,6 +25,7 @@ from linkedin_mcp_server.exceptions import (
     BrowserSetupInProgressError,
     DockerHostLoginRequiredError,
 )
+from linkedin_mcp_server.scraping.cache import get_scrape_cache
 from linkedin_mcp_server.session_state import (
     auth_root_dir,
     get_runtime_id,
@@ -36,11 +36,16 @@ from linkedin_mcp_server.session_state import (
 )
 from linkedin_mcp_server.setup import interactive_login
 
+if TYPE_CHECKING:
+    from fastmcp import Context
+
 logger = logging.getLogger(__name__)
 
 _BROWSER_DIR = "patchright-browsers"
 _BROWSER_INSTALL_METADATA = "browser-install.json"
 _INVALID_STATE_PREFIX = "invalid-state-"
+# Seconds a passed readiness gate is trusted before re-checking disk state
+_READY_CHECK_TTL = 5.0
 
 
 class RuntimePolicy(str, Enum):
@@ -76,6 +81,7 @@ class BootstrapState:
     setup_task: asyncio.Task[None] | None = None
     login_task: asyncio.Task[None] | None = None
     initialized: bool = False
+    ready_checked_at: float | None = None
 
 
 _state = BootstrapState()
@@ -288,8 +294,15 @@ async def ensure_tool_ready_or_raise(
     initialize_bootstrap()
     await _refresh_background_task_state()
 
+    if (
+        _state.ready_checked_at is not None
+        and time.monotonic() - _state.ready_checked_at < _READY_CHECK_TTL
+    ):
+        return
+
     if get_runtime_policy() == RuntimePolicy.DOCKER:
         _raise_if_docker_auth_missing()
+        _state.ready_checked_at = time.monotonic()
         return
 
     if _browser_setup_ready():
@@ -311,6 +324,7 @@ async def ensure_tool_ready_or_raise(
 
     if _auth_ready():
         _state.auth_state = AuthState.READY
+        _state.ready_checked_at = time.monotonic()
         return
 
     await _start_login_if_needed(ctx)
@@ -361,7 +375,7 @@ async def _start_login_if_needed(ctx: Context | None = None) -> None:
                 "No valid LinkedIn session is available yet. LinkedIn login is already in progress in a browser window. Complete login there, then retry this tool."
             )
 
-        _move_invalid_auth_state_aside()
+        await asyncio.to_thread(_move_invalid_auth_state_aside)
         _state.auth_state = AuthState.STARTING
         _state.auth_started_at = utcnow_iso()
         _state.last_error = None
@@ -401,6 +415,7 @@ async def invalidate_auth_and_trigger_relogin(
         AuthenticationInProgressError: Login already running from a prior call.
     """
     logger.warning("Invalidating stale auth state and triggering re-login")
+    _state.ready_checked_at = None
     async with _lock:
         await _refresh_background_task_state()
 
@@ -418,8 +433,9 @@ async def invalidate_auth_and_trigger_relogin(
                 "then retry this tool."
             )
 
-        # Force-move stale profile files (skip _auth_ready() guard).
-        _force_move_auth_state_aside()
+        # Force-move stale profile files (skip _auth_ready() guard). Moving a
+        # Chrome profile can fall back to a full copy, so keep it off the loop.
+        await asyncio.to_thread(_force_move_auth_state_aside)
 
         # Start fresh login.
         _state.auth_state = AuthState.STARTING
@@ -445,6 +461,9 @@ async def invalidate_auth_and_trigger_relogin(
 def _move_auth_state_aside(*, force: bool = False) -> None:
     """Move auth artifacts to a timestamped backup directory.
 
+    Also clears the scrape cache, since its entries were scraped as the
+    account whose session is being discarded.
+
     Args:
         force: If True, skip the ``_auth_ready()`` guard.  Used by
             ``invalidate_auth_and_trigger_relogin`` when the caller already
@@ -468,8 +487,12 @@ def _move_auth_state_aside(*, force: bool = False) -> None:
         / f"{_INVALID_STATE_PREFIX}{utcnow_iso().replace(':', '-')}"
     )
     secure_mkdir(backup_dir)
+    _state.ready_checked_at = None
     for target in existing:
         shutil.move(str(target), str(backup_dir / target.name))
+    cleared = get_scrape_cache().clear()
+    if cleared:
+        logger.info("Cleared %d cached scrape results with the old session", cleared)
 
 
 def _force_move_auth_state_aside() -> None:
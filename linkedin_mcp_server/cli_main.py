@@ -19,11 +19,13 @@ from linkedin_mcp_server.drivers.browser import (
     close_browser,
     get_or_create_browser,
     get_profile_dir,
+    has_browser,
     profile_exists,
     set_headless,
 )
 from linkedin_mcp_server.debug_trace import should_keep_traces
 from linkedin_mcp_server.logging_config import configure_logging, teardown_trace_logging
+from linkedin_mcp_server.scraping.cache import enable_persistent_scrape_cache
 from linkedin_mcp_server.session_state import (
     get_runtime_id,
     load_runtime_state,
@@ -31,9 +33,9 @@ from linkedin_mcp_server.session_state import (
     portable_cookie_path,
     runtime_profile_dir,
     runtime_storage_state_path,
+    scrape_cache_path,
     source_state_path,
 )
-from linkedin_mcp_server.server import create_mcp_server
 from linkedin_mcp_server.setup import run_profile_creation
 
 logger = logging.getLogger(__name__)
@@ -78,6 +80,7 @@ def clear_profile_and_exit() -> None:
         profile_exists(get_profile_dir())
         or portable_cookie_path(get_profile_dir()).exists()
         or source_state_path(get_profile_dir()).exists()
+        or scrape_cache_path(get_profile_dir()).exists()
     ):
         print("ℹ️  No authentication state found")
         print("Nothing to clear.")
@@ -311,6 +314,12 @@ def main() -> None:
                 print("\n🚀 Server ready! Choose transport mode:")
                 transport = choose_transport_interactive()
 
+            # Imported here so --login/--logout/--status skip loading FastMCP
+            from linkedin_mcp_server.server import create_mcp_server
+
+            if config.server.persist_scrape_cache:
+                enable_persistent_scrape_cache(scrape_cache_path())
+
             # Create and run the MCP server
             mcp = create_mcp_server()
 
@@ -338,10 +347,13 @@ def main() -> None:
 
 def exit_gracefully(exit_code: int = 0) -> None:
     """Exit the application gracefully with browser cleanup."""
-    try:
-        asyncio.run(close_browser())
-    except Exception:
-        pass  # Best effort cleanup
+    # The server lifespan usually closed the browser already; don't spin up
+    # a fresh event loop just to find nothing to close.
+    if has_browser():
+        try:
+            asyncio.run(close_browser())
+        except Exception:
+            pass  # Best effort cleanup
     sys.exit(exit_code)
 
 
@@ -52,6 +52,7 @@ class EnvironmentKeys:
     VIEWPORT = "VIEWPORT"
     CHROME_PATH = "CHROME_PATH"
     USER_DATA_DIR = "USER_DATA_DIR"
+    PERSIST_SCRAPE_CACHE = "PERSIST_SCRAPE_CACHE"
 
 
 def is_interactive_environment() -> bool:
@@ -103,6 +104,14 @@ def load_from_env(config: AppConfig) -> AppConfig:
     if user_data_dir := os.environ.get(EnvironmentKeys.USER_DATA_DIR):
         config.browser.user_data_dir = user_data_dir
 
+    # On-disk scrape cache
+    if persist_env := os.environ.get(EnvironmentKeys.PERSIST_SCRAPE_CACHE):
+        persist_value = _normalize_env(persist_env)
+        if persist_value in TRUTHY_VALUES:
+            config.server.persist_scrape_cache = True
+        elif persist_value in FALSY_VALUES:
+            config.server.persist_scrape_cache = False
+
     # Timeout for page operations (validated in BrowserConfig.validate())
     if timeout_env := os.environ.get(EnvironmentKeys.TIMEOUT):
         try:
@@ -271,6 +280,12 @@ def load_from_args(config: AppConfig) -> AppConfig:
         help="Path to persistent browser profile directory (default: ~/.linkedin-mcp/profile)",
     )
 
+    parser.add_argument(
+        "--persist-scrape-cache",
+        action="store_true",
+        help="Keep cached profile/company/job results on disk across restarts",
+    )
+
     args = parser.parse_args()
 
     # Update configuration with parsed arguments
@@ -330,6 +345,9 @@ def load_from_args(config: AppConfig) -> AppConfig:
     if args.user_data_dir:
         config.browser.user_data_dir = args.user_data_dir
 
+    if args.persist_scrape_cache:
+        config.server.persist_scrape_cache = True
+
     return config
 
 
@@ -66,6 +66,7 @@ class ServerConfig:
     login: bool = False
     status: bool = False  # Check session validity and exit
     logout: bool = False
+    persist_scrape_cache: bool = False  # Keep cached scrape results across restarts
     # HTTP transport configuration
     host: str = "127.0.0.1"
     port: int = 8000
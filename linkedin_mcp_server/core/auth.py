@@ -2,7 +2,6 @@
 
 import asyncio
 import logging
-import re
 from urllib.parse import urlparse
 
 from patchright.async_api import Page, TimeoutError as PlaywrightTimeoutError
@@ -29,6 +28,12 @@ _AUTH_BARRIER_TEXT_MARKERS = (
     ("choose an account", "sign in using another account"),
     ("continue as", "sign in using another account"),
 )
+_NAV_SELECTORS = (
+    # Legacy global nav
+    '.global-nav__primary-link, [data-control-name="nav.settings"], '
+    # Current nav
+    'nav a[href*="/feed"], nav button:has-text("Home"), nav a[href*="/mynetwork"]'
+)
 _REMEMBER_ME_CONTAINER_SELECTOR = "#rememberme-div"
 _REMEMBER_ME_BUTTON_SELECTOR = "#rememberme-div button"
 
@@ -76,13 +81,8 @@ async def is_logged_in(page: Page) -> bool:
             return False
 
         # Step 2: Selector check (PRIMARY)
-        old_selectors = '.global-nav__primary-link, [data-control-name="nav.settings"]'
-        old_count = await page.locator(old_selectors).count()
-
-        new_selectors = 'nav a[href*="/feed"], nav button:has-text("Home"), nav a[href*="/mynetwork"]'
-        new_count = await page.locator(new_selectors).count()
-
-        has_nav_elements = old_count > 0 or new_count > 0
+        # Old and new nav markup are matched in one locator round trip.
+        has_nav_elements = await page.locator(_NAV_SELECTORS).count() > 0
 
         # Step 3: URL fallback
         authenticated_only_pages = [
@@ -152,7 +152,7 @@ async def _detect_auth_barrier(
         if not isinstance(body_text, str):
             body_text = ""
 
-        normalized = re.sub(r"\s+", " ", body_text).strip().lower()
+        normalized = " ".join(body_text.split()).lower()
         for marker_group in _AUTH_BARRIER_TEXT_MARKERS:
             if all(marker in normalized for marker in marker_group):
                 return f"auth barrier text: {' + '.join(marker_group)}"
@@ -234,7 +234,12 @@ async def resolve_remember_me_prompt(page: Page) -> bool:
             await page.wait_for_load_state("domcontentloaded", timeout=10000)
         except PlaywrightTimeoutError:
             logger.debug("Remember-me prompt click did not finish loading in time")
-        await asyncio.sleep(1)
+        try:
+            await page.wait_for_selector(
+                _REMEMBER_ME_CONTAINER_SELECTOR, state="hidden", timeout=1000
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("Remember-me container still visible after click")
         return True
     except PlaywrightTimeoutError:
         logger.debug("Remember-me prompt was present but not clickable in time")
@@ -1,5 +1,6 @@
 """Browser lifecycle management using Patchright with persistent context."""
 
+import asyncio
 import json
 import logging
 import os
@@ -23,6 +24,8 @@ logger = logging.getLogger(__name__)
 _DEFAULT_USER_DATA_DIR = Path.home() / ".linkedin-mcp" / "profile"
 _PRIVATE_DIR_MODE = 0o700
 _PRIVATE_FILE_MODE = 0o600
+# Origins whose cookies make up a portable LinkedIn session
+_LINKEDIN_COOKIE_URLS = ["https://www.linkedin.com/", "https://linkedin.com/"]
 
 
 def _harden_linkedin_tree(path: Path) -> None:
@@ -168,10 +171,7 @@ class BrowserManager:
     async def set_cookie(
         self, name: str, value: str, domain: str = ".linkedin.com"
     ) -> None:
-        if not self._context:
-            raise RuntimeError("No browser context")
-
-        await self._context.add_cookies(
+        await self.context.add_cookies(
             [{"name": name, "value": value, "domain": domain, "path": "/"}]
         )
         logger.debug("Cookie set: %s", name)
@@ -207,23 +207,27 @@ class BrowserManager:
 
         path = Path(cookie_path) if cookie_path else self._default_cookie_path()
         try:
-            all_cookies = await self._context.cookies()
+            # Let the browser pre-filter by URL so unrelated third-party
+            # cookies are never serialized over CDP.
+            linkedin_cookies = await self._context.cookies(_LINKEDIN_COOKIE_URLS)
             cookies = [
                 self._normalize_cookie_domain(c)
-                for c in all_cookies
+                for c in linkedin_cookies
                 if "linkedin.com" in c.get("domain", "")
             ]
-            secure_mkdir(path.parent)
-            _harden_linkedin_tree(path.parent)
-            secure_write_text(
-                path, json.dumps(cookies, indent=2), mode=_PRIVATE_FILE_MODE
-            )
+            await asyncio.to_thread(self._write_cookie_file, path, cookies)
             logger.info("Exported %d LinkedIn cookies to %s", len(cookies), path)
             return True
         except Exception:
             logger.exception("Failed to export cookies")
             return False
 
+    @staticmethod
+    def _write_cookie_file(path: Path, cookies: list[Any]) -> None:
+        secure_mkdir(path.parent)
+        _harden_linkedin_tree(path.parent)
+        secure_write_text(path, json.dumps(cookies, indent=2), mode=_PRIVATE_FILE_MODE)
+
     async def export_storage_state(
         self, path: str | Path, *, indexed_db: bool = True
     ) -> bool:
@@ -324,7 +328,7 @@ class BrowserManager:
             return False
 
         try:
-            all_cookies = json.loads(path.read_text())
+            all_cookies = json.loads(await asyncio.to_thread(path.read_text))
             if not all_cookies:
                 logger.debug("Cookie file is empty")
                 return False
@@ -1,6 +1,5 @@
 """Utility functions for scraping operations."""
 
-import asyncio
 import logging
 
 from patchright.async_api import Page, TimeoutError as PlaywrightTimeoutError
@@ -70,20 +69,28 @@ async def scroll_to_bottom(
 ) -> None:
     """Scroll to the bottom of the page to trigger lazy loading.
 
+    The whole loop runs inside a single ``page.evaluate`` call so each
+    iteration costs no extra driver round trips.
+
     Args:
         page: Patchright page object
         pause_time: Time to pause between scrolls (seconds)
         max_scrolls: Maximum number of scroll attempts
     """
-    for i in range(max_scrolls):
-        previous_height = await page.evaluate("document.body.scrollHeight")
-        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(pause_time)
-
-        new_height = await page.evaluate("document.body.scrollHeight")
-        if new_height == previous_height:
-            logger.debug("Reached bottom after %d scrolls", i + 1)
-            break
+    scrolls = await page.evaluate(
+        """async ({pauseTime, maxScrolls}) => {
+            for (let i = 0; i < maxScrolls; i++) {
+                const prevHeight = document.body.scrollHeight;
+                window.scrollTo(0, prevHeight);
+                await new Promise(r => setTimeout(r, pauseTime * 1000));
+                if (document.body.scrollHeight === prevHeight) return i + 1;
+            }
+            return -1;
+        }""",
+        {"pauseTime": pause_time, "maxScrolls": max_scrolls},
+    )
+    if isinstance(scrolls, int) and scrolls > 0:
+        logger.debug("Reached bottom after %d scrolls", scrolls)
 
 
 async def scroll_job_sidebar(
@@ -165,7 +172,10 @@ async def handle_modal_close(page: Page) -> bool:
 
         if await close_button.is_visible(timeout=1000):
             await close_button.click()
-            await asyncio.sleep(0.5)
+            try:
+                await close_button.wait_for(state="hidden", timeout=500)
+            except PlaywrightTimeoutError:
+                logger.debug("Modal dismiss button still visible after click")
             logger.debug("Closed modal")
             return True
     except PlaywrightTimeoutError:
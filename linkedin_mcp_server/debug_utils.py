@@ -8,6 +8,13 @@ import os
 
 _NAV_STABILIZE_DELAY_SECONDS = 5.0
 
+# Collapse and trim body text in the page so failure diagnostics never ship
+# the whole document over CDP just to log its first 200 characters.
+BODY_MARKER_SCRIPT = """() => (document.body?.innerText || '')
+    .replace(/\\s+/g, ' ')
+    .trim()
+    .slice(0, 200)"""
+
 
 def debug_stabilize_navigation_enabled() -> bool:
     """Return whether debug-only navigation stabilization sleeps are enabled."""
@@ -6,6 +6,7 @@ context. Implements a singleton pattern for browser reuse across tool calls with
 automatic profile persistence.
 """
 
+import asyncio
 import logging
 import os
 from pathlib import Path
@@ -23,7 +24,7 @@ from linkedin_mcp_server.core import (
 from linkedin_mcp_server.common_utils import utcnow_iso
 from linkedin_mcp_server.config import get_config
 from linkedin_mcp_server.debug_trace import record_page_trace
-from linkedin_mcp_server.debug_utils import stabilize_navigation
+from linkedin_mcp_server.debug_utils import BODY_MARKER_SCRIPT, stabilize_navigation
 from linkedin_mcp_server.session_state import (
     SourceState,
     clear_runtime_profile,
@@ -47,6 +48,7 @@ DEFAULT_PROFILE_DIR = Path.home() / ".linkedin-mcp" / "profile"
 _browser: BrowserManager | None = None
 _browser_cookie_export_path: Path | None = None
 _headless: bool = True
+_browser_lock = asyncio.Lock()
 
 
 def _debug_skip_checkpoint_restart() -> bool:
@@ -95,21 +97,17 @@ async def _log_feed_failure_context(
     """Log the page state when /feed/ validation fails."""
     page = browser.page
 
-    try:
-        title = await page.title()
-    except Exception:
+    title, remember_me_count, body_text = await asyncio.gather(
+        page.title(),
+        page.locator("#rememberme-div").count(),
+        page.evaluate(BODY_MARKER_SCRIPT),
+        return_exceptions=True,
+    )
+    if isinstance(title, BaseException):
         title = ""
-
-    try:
-        remember_me = (await page.locator("#rememberme-div").count()) > 0
-    except Exception:
-        remember_me = False
-
-    try:
-        body_text = await page.evaluate("() => document.body?.innerText || ''")
-    except Exception:
-        body_text = ""
-
+    remember_me = (
+        not isinstance(remember_me_count, BaseException) and remember_me_count > 0
+    )
     if not isinstance(body_text, str):
         body_text = ""
 
@@ -244,7 +242,9 @@ async def _bridge_runtime_profile(
 ) -> BrowserManager:
     source_profile_dir = get_source_profile_dir()
     bridge_started_at = utcnow_iso()
-    clear_runtime_profile(runtime_id, source_profile_dir)
+    # A stale Chromium profile can hold thousands of files; keep the rmtree
+    # off the event loop.
+    await asyncio.to_thread(clear_runtime_profile, runtime_id, source_profile_dir)
     secure_mkdir(profile_dir.parent)
     storage_state_path = runtime_storage_state_path(runtime_id, source_profile_dir)
     browser = _make_browser(
@@ -338,7 +338,7 @@ async def _bridge_runtime_profile(
             raise
     except Exception:
         await browser.close()
-        clear_runtime_profile(runtime_id, source_profile_dir)
+        await asyncio.to_thread(clear_runtime_profile, runtime_id, source_profile_dir)
         raise
 
 
@@ -360,7 +360,7 @@ async def get_or_create_browser(
     Raises:
         AuthenticationError: If no valid authentication found
     """
-    global _browser, _browser_cookie_export_path, _headless
+    global _headless
 
     if headless is not None:
         _headless = headless
@@ -368,6 +368,18 @@ async def get_or_create_browser(
     if _browser is not None:
         return _browser
 
+    # Concurrent first callers wait for one launch instead of each starting
+    # a Chromium against the same persistent profile.
+    async with _browser_lock:
+        if _browser is not None:
+            return _browser
+        return await _create_browser()
+
+
+async def _create_browser() -> BrowserManager:
+    """Launch and authenticate the shared browser; caller holds the lock."""
+    global _browser, _browser_cookie_export_path
+
     launch_options, viewport = _launch_options()
     source_profile_dir = get_profile_dir()
     cookie_path = portable_cookie_path(source_profile_dir)
@@ -506,6 +518,11 @@ async def close_browser() -> None:
     logger.info("Browser closed")
 
 
+def has_browser() -> bool:
+    """Return whether a browser is currently open and would need closing."""
+    return _browser is not None
+
+
 def get_profile_dir() -> Path:
     """Get the resolved profile directory from config."""
     return get_source_profile_dir()
@@ -564,7 +581,8 @@ async def check_rate_limit() -> None:
 
 def reset_browser_for_testing() -> None:
     """Reset global browser state for test isolation."""
-    global _browser, _browser_cookie_export_path, _headless
+    global _browser, _browser_cookie_export_path, _headless, _browser_lock
     _browser = None
     _browser_cookie_export_path = None
     _headless = True
+    _browser_lock = asyncio.Lock()
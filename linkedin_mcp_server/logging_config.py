@@ -11,7 +11,7 @@ import atexit
 import json
 import logging
 import os
-from typing import Any, Dict
+from typing import Any
 
 from linkedin_mcp_server.common_utils import secure_mkdir
 from linkedin_mcp_server.debug_trace import cleanup_trace_dir, get_trace_dir
@@ -32,7 +32,7 @@ class MCPJSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string
         """
-        log_data: Dict[str, Any] = {
+        log_data: dict[str, Any] = {
             "timestamp": self.formatTime(record),
             "level": record.levelname,
             "logger": record.name,
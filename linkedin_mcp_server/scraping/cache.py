@@ -0,0 +1,231 @@
+"""In-memory TTL cache for scraped LinkedIn pages.
+
+Profiles, companies, and job postings change on the order of hours, while
+agents often request the same page several times within one session. Caching
+the final tool result skips the browser navigation entirely on a hit.
+
+The cache can optionally be backed by a SQLite file so entries survive a
+server restart, which matters for MCP clients that spawn a fresh stdio
+server per conversation. Every statement runs on one background writer
+thread, so tool calls never wait on a commit. The only call that waits for
+the disk is the single-row primary-key lookup on an in-memory miss, which
+happens at most once per key per process.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import copy
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from linkedin_mcp_server.common_utils import secure_mkdir
+
+logger = logging.getLogger(__name__)
+
+# Time-to-live per scrape kind, in seconds
+PERSON_TTL = 900.0
+COMPANY_TTL = 3600.0
+JOB_TTL = 300.0
+
+_DEFAULT_MAXSIZE = 512
+
+
+class ScrapeCache:
+    """Bounded LRU cache whose entries expire after a per-entry TTL.
+
+    Values are deep-copied on the way in and out so callers can mutate the
+    returned dicts (e.g. to add ``unknown_sections``) without corrupting the
+    cached entry.
+    """
+
+    def __init__(self, maxsize: int = _DEFAULT_MAXSIZE, path: Path | None = None):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._db: sqlite3.Connection | None = None
+        self._writer: ThreadPoolExecutor | None = None
+        if path is not None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="scrape-cache"
+            )
+            self._db = self._writer.submit(_open_db, path).result()
+            if self._db is None:
+                self._writer.shutdown()
+                self._writer = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Return a copy of the cached value, or None when missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return self._load(key)
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        logger.debug("Scrape cache hit for %s", key)
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: dict[str, Any], ttl: float) -> None:
+        """Store a copy of *value* for *ttl* seconds, evicting the LRU entry."""
+        self._remember(key, copy.deepcopy(value), ttl)
+        if self._db is not None:
+            self._submit(
+                "INSERT OR REPLACE INTO scrape_cache VALUES (?, ?, ?)",
+                (_key_text(key), json.dumps(value), time.time() + ttl),
+            )
+
+    def clear(self) -> int:
+        """Drop every cached entry and return how many were removed."""
+        cleared = len(self._entries)
+        self._entries.clear()
+        if self._db is not None:
+            rowcount = self._submit(
+                "DELETE FROM scrape_cache", fetch=lambda c: c.rowcount
+            ).result()
+            if rowcount is not None:
+                cleared = max(cleared, rowcount)
+        return cleared
+
+    def flush(self) -> None:
+        """Block until every queued disk write has been committed."""
+        if self._writer is not None:
+            self._writer.submit(lambda: None).result()
+
+    def _remember(self, key: Hashable, value: dict[str, Any], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: Hashable) -> dict[str, Any] | None:
+        """Fall back to the on-disk store, promoting a live hit into memory."""
+        if self._db is None:
+            return None
+        key_text = _key_text(key)
+        row = self._submit(
+            "SELECT value, expires_at FROM scrape_cache WHERE key = ?",
+            (key_text,),
+            fetch=lambda c: c.fetchone(),
+        ).result()
+        if row is None:
+            return None
+        remaining = row[1] - time.time()
+        if remaining <= 0:
+            self._submit("DELETE FROM scrape_cache WHERE key = ?", (key_text,))
+            return None
+        value = json.loads(row[0])
+        self._remember(key, value, remaining)
+        logger.debug("Scrape cache disk hit for %s", key)
+        return copy.deepcopy(value)
+
+    def _submit(
+        self,
+        sql: str,
+        params: tuple[Any, ...] = (),
+        *,
+        fetch: Callable[[sqlite3.Cursor], Any] | None = None,
+    ) -> Future[Any]:
+        """Queue one statement on the writer thread, in submission order.
+
+        Callers that need the outcome wait on the returned future; writes are
+        fire-and-forget.
+        """
+        assert self._writer is not None
+        return self._writer.submit(self._execute, sql, params, fetch)
+
+    def _execute(
+        self,
+        sql: str,
+        params: tuple[Any, ...],
+        fetch: Callable[[sqlite3.Cursor], Any] | None,
+    ) -> Any:
+        """Run one statement; disk failures degrade to a memory-only cache."""
+        if self._db is None:
+            return None
+        try:
+            with self._db:
+                cursor = self._db.execute(sql, params)
+                return fetch(cursor) if fetch is not None else None
+        except sqlite3.Error as exc:
+            logger.warning("Scrape cache disk store failed: %s", exc)
+            return None
+
+
+def _open_db(path: Path) -> sqlite3.Connection | None:
+    """Open (creating if needed) the private SQLite store and drop stale rows."""
+    try:
+        secure_mkdir(path.parent)
+        # Create the file private up front; chmod after connect would leave
+        # cached profiles readable under the process umask in the meantime
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o600))
+        os.chmod(path, 0o600)
+        db = sqlite3.connect(path)
+        with db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS scrape_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            db.execute("DELETE FROM scrape_cache WHERE expires_at <= ?", (time.time(),))
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("Scrape cache disk store unavailable at %s: %s", path, exc)
+        return None
+    return db
+
+
+def _key_text(key: Hashable) -> str:
+    """Serialize a cache key; section sets are sorted so the text is stable."""
+    parts = key if isinstance(key, tuple) else (key,)
+    return json.dumps(
+        [sorted(part) if isinstance(part, frozenset) else part for part in parts]
+    )
+
+
+_cache = ScrapeCache()
+
+
+def get_scrape_cache() -> ScrapeCache:
+    """Return the process-wide scrape cache."""
+    return _cache
+
+
+def enable_persistent_scrape_cache(path: Path) -> None:
+    """Replace the process-wide cache with one persisted to *path*."""
+    global _cache
+    _cache = ScrapeCache(path=path)
+
+
+def scrape_cache_key(kind: str, identifier: str, *parts: Hashable) -> tuple:
+    """Build a cache key, folding trivially different spellings of a slug.
+
+    LinkedIn vanity names and company slugs are case-insensitive and are
+    often passed with stray whitespace or slashes.
+    """
+    return (kind, identifier.strip().strip("/").lower(), *parts)
+
+
+def is_cacheable(result: dict[str, Any]) -> bool:
+    """Only cache complete results; partial scrapes should be retried."""
+    return (
+        bool(result.get("sections"))
+        and not result.get("section_errors")
+        and not result.get("rate_limited")
+    )
+
+
+def reset_scrape_cache_for_testing() -> None:
+    """Reset the scrape cache for test isolation."""
+    global _cache
+    _cache = ScrapeCache()
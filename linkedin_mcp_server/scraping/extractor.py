@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 import logging
 import re
@@ -21,7 +22,7 @@ from linkedin_mcp_server.core.exceptions import (
     LinkedInScraperException,
 )
 from linkedin_mcp_server.debug_trace import record_page_trace
-from linkedin_mcp_server.debug_utils import stabilize_navigation
+from linkedin_mcp_server.debug_utils import BODY_MARKER_SCRIPT, stabilize_navigation
 from linkedin_mcp_server.error_diagnostics import build_issue_diagnostics
 from linkedin_mcp_server.core.utils import (
     detect_rate_limit,
@@ -53,9 +54,25 @@ _RATE_LIMIT_RETRY_DELAY = 5.0
 # Returned as section text when LinkedIn rate-limits the page
 _RATE_LIMITED_MSG = "[Rate limited] LinkedIn blocked this section. Try again later or request fewer sections."
 
+# Upper bound for waiting on new items after a "Show more" click
+_SHOW_MORE_SETTLE_TIMEOUT_MS = 1000
+
+# Lowercase innerText of empty activity feeds and search results pages, which
+# never reach the usual text-length threshold
+_EMPTY_ACTIVITY_TEXTS = ("hasn't posted yet", "hasn’t posted yet")
+_EMPTY_SEARCH_TEXTS = ("no results found",)
+
+# Label of the pagination button on profile detail pages
+_SHOW_MORE_BUTTON_RE = re.compile(r"^Show (more|all)\b", re.IGNORECASE)
+
 # LinkedIn shows 25 results per page
 _PAGE_SIZE = 25
 
+# "Page 1 of 40" in the job search pagination footer
+_PAGE_TOTAL_RE = re.compile(r"of\s+(\d+)")
+
+_THREAD_ID_RE = re.compile(r"/messaging/thread/([^/?#]+)/")
+
 # Normalization maps for job search filters
 _DATE_POSTED_MAP = {
     "past_hour": "r3600",
@@ -169,8 +186,17 @@ _NOISE_LINES: list[re.Pattern[str]] = [
     re.compile(r"^(?:Loaded:.*|Remaining time.*|Stream Type.*)$"),
 ]
 
+# Each list folded into one alternation so the text is scanned once instead
+# of once per pattern. An alternation's first match is the earliest one.
+_NOISE_MARKER_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _NOISE_MARKERS), re.MULTILINE
+)
+_NOISE_LINE_RE = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in _NOISE_LINES)
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedSection:
     """Text and compact references extracted from a loaded LinkedIn section."""
 
@@ -191,22 +217,15 @@ def strip_linkedin_noise(text: str) -> str:
 def _filter_linkedin_noise_lines(text: str) -> str:
     """Remove known media/control noise lines from already-truncated content."""
     filtered_lines = [
-        line
-        for line in text.splitlines()
-        if not any(pattern.match(line.strip()) for pattern in _NOISE_LINES)
+        line for line in text.splitlines() if not _NOISE_LINE_RE.match(line.strip())
     ]
     return "\n".join(filtered_lines).strip()
 
 
 def _truncate_linkedin_noise(text: str) -> str:
     """Trim known LinkedIn chrome blocks before any per-line noise filtering."""
-    earliest = len(text)
-    for pattern in _NOISE_MARKERS:
-        match = pattern.search(text)
-        if match and match.start() < earliest:
-            earliest = match.start()
-
-    return text[:earliest].strip()
+    match = _NOISE_MARKER_RE.search(text)
+    return (text[: match.start()] if match else text).strip()
 
 
 class LinkedInExtractor:
@@ -220,7 +239,7 @@ class LinkedInExtractor:
         """Compress body text into a short, single-line diagnostic marker."""
         if not isinstance(value, str):
             return ""
-        return re.sub(r"\s+", " ", value).strip()[:200]
+        return " ".join(value.split())[:200]
 
     @staticmethod
     def _single_section_result(
@@ -263,29 +282,26 @@ class LinkedInExtractor:
         hops: list[str],
     ) -> None:
         """Emit structured diagnostics for a failed target navigation."""
-        try:
-            title = await self._page.title()
-        except Exception:
+        # The probes are independent reads, so issue them concurrently
+        title, auth_barrier, remember_me_count, body_text = await asyncio.gather(
+            self._page.title(),
+            detect_auth_barrier(self._page),
+            self._page.locator("#rememberme-div").count(),
+            self._page.evaluate(BODY_MARKER_SCRIPT),
+            return_exceptions=True,
+        )
+        if isinstance(title, BaseException):
             title = ""
-
-        try:
-            auth_barrier = await detect_auth_barrier(self._page)
-        except Exception:
+        if isinstance(auth_barrier, BaseException):
             auth_barrier = None
-
-        try:
-            remember_me_visible = (
-                await self._page.locator("#rememberme-div").count()
-            ) > 0
-        except Exception:
-            remember_me_visible = False
-
-        try:
-            body_marker = self._normalize_body_marker(
-                await self._page.evaluate("() => document.body?.innerText || ''")
-            )
-        except Exception:
-            body_marker = ""
+        remember_me_visible = (
+            not isinstance(remember_me_count, BaseException) and remember_me_count > 0
+        )
+        body_marker = (
+            ""
+            if isinstance(body_text, BaseException)
+            else self._normalize_body_marker(body_text)
+        )
 
         logger.warning(
             "Navigation to %s failed (wait_until=%s, error=%s). "
@@ -596,22 +612,60 @@ class LinkedInExtractor:
         *,
         minimum_length: int = 100,
         timeout: int = 10000,
+        empty_state_texts: tuple[str, ...] = (),
         log_context: str,
     ) -> None:
-        """Wait for main content to populate enough text to scrape."""
+        """Wait for main content to populate enough text to scrape.
+
+        When *empty_state_texts* is given, also returns as soon as main's
+        lowercased text contains one of them, so pages that legitimately have
+        nothing to show do not burn the whole timeout.
+        """
         try:
             await self._page.wait_for_function(
-                """({ minimumLength }) => {
+                """({ minimumLength, emptyStateTexts }) => {
                     const main = document.querySelector('main');
                     if (!main) return false;
-                    return main.innerText.length > minimumLength;
+                    const text = main.innerText;
+                    if (text.length > minimumLength) return true;
+                    const lowered = text.toLowerCase();
+                    return emptyStateTexts.some((marker) => lowered.includes(marker));
                 }""",
-                arg={"minimumLength": minimum_length},
+                arg={
+                    "minimumLength": minimum_length,
+                    "emptyStateTexts": list(empty_state_texts),
+                },
                 timeout=timeout,
             )
         except PlaywrightTimeoutError:
             logger.debug("%s content did not appear", log_context)
 
+    async def _wait_for_main_text_change(
+        self,
+        previous_length: int,
+        *,
+        timeout: int = _SHOW_MORE_SETTLE_TIMEOUT_MS,
+    ) -> None:
+        """Return once main's innerText grows past *previous_length*.
+
+        Used after "Show more" clicks so the loop moves on as soon as the new
+        items render instead of always sleeping for the full *timeout*. Only
+        growth counts, so a transient shrink (e.g. the button turning into a
+        spinner) does not end the wait before the items arrive.
+        """
+        try:
+            await self._page.wait_for_function(
+                """({ previousLength }) => {
+                    const main = document.querySelector('main');
+                    if (!main) return false;
+                    return main.innerText.length > previousLength;
+                }""",
+                arg={"previousLength": previous_length},
+                timeout=timeout,
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("Main content did not change within %dms", timeout)
+
     async def _scroll_main_scrollable_region(
         self,
         *,
@@ -661,26 +715,55 @@ class LinkedInExtractor:
         Returns _RATE_LIMITED_MSG sentinel when soft-rate-limited after retry.
         Returns empty string for unexpected non-domain failures (error isolation).
         """
+        return await self._extract_with_retry(
+            lambda: self._extract_page_once(url, section_name, max_scrolls),
+            url=url,
+            section_name=section_name,
+            kind="page",
+            context="extract_page",
+        )
+
+    async def _extract_with_retry(
+        self,
+        attempt: Callable[[], Awaitable[ExtractedSection]],
+        *,
+        url: str,
+        section_name: str,
+        kind: str,
+        context: str,
+    ) -> ExtractedSection:
+        """Run a single-attempt extractor with one soft rate-limit retry.
+
+        Domain exceptions propagate; any other failure is isolated into an
+        empty section carrying issue diagnostics.
+        """
         try:
-            result = await self._extract_page_once(url, section_name, max_scrolls)
+            result = await attempt()
             if result.text != _RATE_LIMITED_MSG:
                 return result
 
-            # Retry once after backoff
-            logger.info("Retrying %s after %.0fs backoff", url, _RATE_LIMIT_RETRY_DELAY)
+            logger.info(
+                "Retrying %s %s after %.0fs backoff",
+                kind,
+                url,
+                _RATE_LIMIT_RETRY_DELAY,
+            )
             await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
-            return await self._extract_page_once(url, section_name, max_scrolls)
+            result = await attempt()
+            if result.text == _RATE_LIMITED_MSG:
+                logger.warning("%s %s still rate-limited after retry", kind, url)
+            return result
 
         except LinkedInScraperException:
             raise
         except Exception as e:
-            logger.warning("Failed to extract page %s: %s", url, e)
+            logger.warning("Failed to extract %s %s: %s", kind, url, e)
             return ExtractedSection(
                 text="",
                 references=[],
                 error=build_issue_diagnostics(
                     e,
-                    context="extract_page",
+                    context=context,
                     target_url=url,
                     section_name=section_name,
                 ),
@@ -708,33 +791,20 @@ class LinkedInExtractor:
         # Activity feed pages lazy-load post content after the tab header
         is_activity = "/recent-activity/" in url
         if is_activity:
-            try:
-                await self._page.wait_for_function(
-                    """() => {
-                        const main = document.querySelector('main');
-                        if (!main) return false;
-                        return main.innerText.length > 200;
-                    }""",
-                    timeout=10000,
-                )
-            except PlaywrightTimeoutError:
-                logger.debug("Activity feed content did not appear on %s", url)
+            await self._wait_for_main_text(
+                minimum_length=200,
+                empty_state_texts=_EMPTY_ACTIVITY_TEXTS,
+                log_context=f"Activity feed ({url})",
+            )
 
         # Search results pages load a placeholder first then fill in results
         # via JavaScript. Wait for actual content before extracting.
         is_search = "/search/results/" in url
         if is_search:
-            try:
-                await self._page.wait_for_function(
-                    """() => {
-                        const main = document.querySelector('main');
-                        if (!main) return false;
-                        return main.innerText.length > 100;
-                    }""",
-                    timeout=10000,
-                )
-            except PlaywrightTimeoutError:
-                logger.debug("Search results content did not appear on %s", url)
+            await self._wait_for_main_text(
+                empty_state_texts=_EMPTY_SEARCH_TEXTS,
+                log_context=f"Search results ({url})",
+            )
 
         # Profile detail pages (/details/experience/, /details/education/, etc.)
         # initially render sidebar recommendations into <main> while the section
@@ -763,7 +833,7 @@ class LinkedInExtractor:
             max_clicks = max_scrolls if max_scrolls is not None else 5
             for i in range(max_clicks):
                 button = self._page.locator("main button").filter(
-                    has_text=re.compile(r"^Show (more|all)\b", re.IGNORECASE)
+                    has_text=_SHOW_MORE_BUTTON_RE
                 )
                 try:
                     if await button.count() == 0:
@@ -773,8 +843,11 @@ class LinkedInExtractor:
                     if not await target.is_visible():
                         break
                     await target.scroll_into_view_if_needed(timeout=2000)
+                    previous_length = await self._page.evaluate(
+                        "() => document.querySelector('main')?.innerText.length ?? 0"
+                    )
                     await target.click(timeout=2000)
-                    await asyncio.sleep(1.0)
+                    await self._wait_for_main_text_change(previous_length)
                 except PlaywrightTimeoutError:
                     logger.debug("Show more click timed out after %d clicks", i)
                     break
@@ -821,33 +894,13 @@ class LinkedInExtractor:
         Retries once after a backoff when the overlay returns only LinkedIn
         chrome (noise), mirroring `extract_page` behavior.
         """
-        try:
-            result = await self._extract_overlay_once(url, section_name)
-            if result.text != _RATE_LIMITED_MSG:
-                return result
-
-            logger.info(
-                "Retrying overlay %s after %.0fs backoff",
-                url,
-                _RATE_LIMIT_RETRY_DELAY,
-            )
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
-            return await self._extract_overlay_once(url, section_name)
-
-        except LinkedInScraperException:
-            raise
-        except Exception as e:
-            logger.warning("Failed to extract overlay %s: %s", url, e)
-            return ExtractedSection(
-                text="",
-                references=[],
-                error=build_issue_diagnostics(
-                    e,
-                    context="extract_overlay",
-                    target_url=url,
-                    section_name=section_name,
-                ),
-            )
+        return await self._extract_with_retry(
+            lambda: self._extract_overlay_once(url, section_name),
+            url=url,
+            section_name=section_name,
+            kind="overlay",
+            context="extract_overlay",
+        )
 
     async def _extract_overlay_once(
         self,
@@ -900,22 +953,69 @@ class LinkedInExtractor:
         Returns:
             {url, sections: {name: text}, profile_urn?: str}
         """
-        requested = requested | {"main_profile"}
         base_url = f"https://www.linkedin.com/in/{username}"
+        profile_urn: str | None = None
+
+        async def capture_profile_urn(section_name: str) -> None:
+            nonlocal profile_urn
+            if section_name == "main_profile" and profile_urn is None:
+                profile_urn = await self._extract_profile_urn()
+
+        result = await self._scrape_sections(
+            base_url,
+            PERSON_SECTIONS,
+            requested | {"main_profile"},
+            label="person profile",
+            context="scrape_person",
+            callbacks=callbacks,
+            max_scrolls=max_scrolls,
+            after_section=capture_profile_urn,
+        )
+        if profile_urn:
+            result["profile_urn"] = profile_urn
+
+        if callbacks:
+            await callbacks.on_complete("person profile", result)
+
+        return result
+
+    async def _scrape_sections(
+        self,
+        base_url: str,
+        section_map: dict[str, tuple[str, bool]],
+        requested: set[str],
+        *,
+        label: str,
+        context: str,
+        callbacks: ProgressCallback | None = None,
+        max_scrolls: int | None = None,
+        after_section: Callable[[str], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
+        """Visit each requested section page in ``section_map`` order.
+
+        Per-section failures are isolated into ``section_errors`` and sections
+        still soft-rate-limited after the retry are listed in ``rate_limited``;
+        scraper exceptions (auth, rate limit) abort the loop and are reported
+        to *callbacks*. ``on_complete`` is left to the caller so it can add
+        fields to the result first.
+
+        Returns:
+            {url, sections, references?, section_errors?, rate_limited?}
+        """
         sections: dict[str, str] = {}
         references: dict[str, list[Reference]] = {}
         section_errors: dict[str, dict[str, Any]] = {}
-        profile_urn: str | None = None
+        rate_limited: list[str] = []
 
         requested_ordered = [
             (name, suffix, is_overlay)
-            for name, (suffix, is_overlay) in PERSON_SECTIONS.items()
+            for name, (suffix, is_overlay) in section_map.items()
             if name in requested
         ]
         total = len(requested_ordered)
 
         if callbacks:
-            await callbacks.on_start("person profile", base_url)
+            await callbacks.on_start(label, base_url)
 
         try:
             for i, (section_name, suffix, is_overlay) in enumerate(requested_ordered):
@@ -935,22 +1035,24 @@ class LinkedInExtractor:
                             max_scrolls=max_scrolls,
                         )
 
-                    if extracted.text and extracted.text != _RATE_LIMITED_MSG:
+                    if extracted.text == _RATE_LIMITED_MSG:
+                        rate_limited.append(section_name)
+                    elif extracted.text:
                         sections[section_name] = extracted.text
                         if extracted.references:
                             references[section_name] = extracted.references
                     elif extracted.error:
                         section_errors[section_name] = extracted.error
 
-                    if section_name == "main_profile" and profile_urn is None:
-                        profile_urn = await self._extract_profile_urn()
+                    if after_section is not None:
+                        await after_section(section_name)
                 except LinkedInScraperException:
                     raise
                 except Exception as e:
                     logger.warning("Error scraping section %s: %s", section_name, e)
                     section_errors[section_name] = build_issue_diagnostics(
                         e,
-                        context="scrape_person",
+                        context=context,
                         target_url=url,
                         section_name=section_name,
                     )
@@ -971,17 +1073,47 @@ class LinkedInExtractor:
             "url": f"{base_url}/",
             "sections": sections,
         }
-        if profile_urn:
-            result["profile_urn"] = profile_urn
         if references:
             result["references"] = references
         if section_errors:
             result["section_errors"] = section_errors
+        if rate_limited:
+            result["rate_limited"] = rate_limited
+        return result
 
-        if callbacks:
-            await callbacks.on_complete("person profile", result)
+    async def scrape_people(
+        self,
+        usernames: list[str],
+        requested: set[str],
+        max_scrolls: int | None = None,
+        on_result: Callable[[int, dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Scrape several person profiles in one call.
 
-        return result
+        All profiles share this extractor's single page, so they are visited
+        back to back with the usual navigation delay rather than concurrently.
+        Auth and rate-limit errors abort the batch like they do for a single
+        profile; per-section failures land in each result's section_errors.
+
+        Args:
+            on_result: Awaited with (index, result) as soon as each profile is
+                scraped, so callers keep finished profiles if the batch aborts
+                and can report progress per profile.
+
+        Returns:
+            One ``scrape_person`` result per username, in input order.
+        """
+        results: list[dict[str, Any]] = []
+        for i, username in enumerate(usernames):
+            if i > 0:
+                await asyncio.sleep(_NAV_DELAY)
+            result = await self.scrape_person(
+                username, requested, max_scrolls=max_scrolls
+            )
+            if on_result is not None:
+                await on_result(i, result)
+            results.append(result)
+        return results
 
     async def connect_with_person(
         self,
@@ -1613,14 +1745,20 @@ class LinkedInExtractor:
             return
         try:
             await self._click_first(_MESSAGING_CLOSE_SELECTOR, timeout=1500)
-            await asyncio.sleep(0.5)
         except Exception:
             logger.debug("Could not dismiss LinkedIn messaging UI", exc_info=True)
+            return
+        try:
+            await self._page.locator(_MESSAGING_CLOSE_SELECTOR).first.wait_for(
+                state="hidden", timeout=500
+            )
+        except PlaywrightTimeoutError:
+            logger.debug("Messaging UI still visible after dismiss click")
 
     @staticmethod
     def _extract_thread_id(url: str) -> str | None:
         """Parse a LinkedIn thread id from a messaging thread URL."""
-        match = re.search(r"/messaging/thread/([^/?#]+)/", url)
+        match = _THREAD_ID_RE.search(url)
         return match.group(1) if match else None
 
     async def _resolve_conversation_thread_url(self, search_query: str) -> str | None:
@@ -1757,75 +1895,14 @@ class LinkedInExtractor:
         Returns:
             {url, sections: {name: text}}
         """
-        requested = requested | {"about"}
-        base_url = f"https://www.linkedin.com/company/{company_name}"
-        sections: dict[str, str] = {}
-        references: dict[str, list[Reference]] = {}
-        section_errors: dict[str, dict[str, Any]] = {}
-
-        requested_ordered = [
-            (name, suffix, is_overlay)
-            for name, (suffix, is_overlay) in COMPANY_SECTIONS.items()
-            if name in requested
-        ]
-        total = len(requested_ordered)
-
-        if callbacks:
-            await callbacks.on_start("company profile", base_url)
-
-        try:
-            for i, (section_name, suffix, is_overlay) in enumerate(requested_ordered):
-                if i > 0:
-                    await asyncio.sleep(_NAV_DELAY)
-
-                url = base_url + suffix
-                try:
-                    if is_overlay:
-                        extracted = await self._extract_overlay(
-                            url, section_name=section_name
-                        )
-                    else:
-                        extracted = await self.extract_page(
-                            url, section_name=section_name
-                        )
-
-                    if extracted.text and extracted.text != _RATE_LIMITED_MSG:
-                        sections[section_name] = extracted.text
-                        if extracted.references:
-                            references[section_name] = extracted.references
-                    elif extracted.error:
-                        section_errors[section_name] = extracted.error
-                except LinkedInScraperException:
-                    raise
-                except Exception as e:
-                    logger.warning("Error scraping section %s: %s", section_name, e)
-                    section_errors[section_name] = build_issue_diagnostics(
-                        e,
-                        context="scrape_company",
-                        target_url=url,
-                        section_name=section_name,
-                    )
-
-                # "Scraped" = processed/attempted, not necessarily successful.
-                # Per-section failures are captured in section_errors.
-                if callbacks:
-                    percent = round((i + 1) / total * 95)
-                    await callbacks.on_progress(
-                        f"Scraped {section_name} ({i + 1}/{total})", percent
-                    )
-        except LinkedInScraperException as e:
-            if callbacks:
-                await callbacks.on_error(e)
-            raise
-
-        result: dict[str, Any] = {
-            "url": f"{base_url}/",
-            "sections": sections,
-        }
-        if references:
-            result["references"] = references
-        if section_errors:
-            result["section_errors"] = section_errors
+        result = await self._scrape_sections(
+            f"https://www.linkedin.com/company/{company_name}",
+            COMPANY_SECTIONS,
+            requested | {"about"},
+            label="company profile",
+            context="scrape_company",
+            callbacks=callbacks,
+        )
 
         if callbacks:
             await callbacks.on_complete("company profile", result)
@@ -1894,36 +1971,13 @@ class LinkedInExtractor:
         ``extract_page`` / ``_extract_page_once`` so that callers get a
         ``_RATE_LIMITED_MSG`` sentinel instead of silent empty results.
         """
-        try:
-            result = await self._extract_search_page_once(url, section_name)
-            if result.text != _RATE_LIMITED_MSG:
-                return result
-
-            logger.info(
-                "Retrying search page %s after %.0fs backoff",
-                url,
-                _RATE_LIMIT_RETRY_DELAY,
-            )
-            await asyncio.sleep(_RATE_LIMIT_RETRY_DELAY)
-            result = await self._extract_search_page_once(url, section_name)
-            if result.text == _RATE_LIMITED_MSG:
-                logger.warning("Search page %s still rate-limited after retry", url)
-            return result
-
-        except LinkedInScraperException:
-            raise
-        except Exception as e:
-            logger.warning("Failed to extract search page %s: %s", url, e)
-            return ExtractedSection(
-                text="",
-                references=[],
-                error=build_issue_diagnostics(
-                    e,
-                    context="extract_search_page",
-                    target_url=url,
-                    section_name=section_name,
-                ),
-            )
+        return await self._extract_with_retry(
+            lambda: self._extract_search_page_once(url, section_name),
+            url=url,
+            section_name=section_name,
+            kind="search page",
+            context="extract_search_page",
+        )
 
     async def _extract_search_page_once(
         self,
@@ -1991,7 +2045,7 @@ class LinkedInExtractor:
         )
         if not text:
             return None
-        match = re.search(r"of\s+(\d+)", text)
+        match = _PAGE_TOTAL_RE.search(text)
         return int(match.group(1)) if match else None
 
     @staticmethod
@@ -113,6 +113,12 @@ _NEWSLETTER_PATH_RE = re.compile(r"^/newsletters/([^/?#]+)")
 _PULSE_PATH_RE = re.compile(r"^/pulse/([^/?#]+)")
 _FEED_PATH_RE = re.compile(r"^/feed/update/([^/?#]+)")
 _MESSAGING_THREAD_PATH_RE = re.compile(r"^/messaging/thread/([^/?#]+)")
+_LABEL_PREFIX_RE = re.compile(
+    r"^(?:View:\s*|View\b\s+|Open article:\s*)", re.IGNORECASE
+)
+_POSSESSIVE_GRAPHIC_LINK_RE = re.compile(r"[’']s\s+graphic link$", re.IGNORECASE)
+_GRAPHIC_LINK_RE = re.compile(r"\s+graphic link$", re.IGNORECASE)
+_ALNUM_RE = re.compile(r"[A-Za-z0-9]")
 _MAX_REDIRECT_UNWRAP_DEPTH = 5
 
 
@@ -122,14 +128,11 @@ def build_references(
 ) -> list[Reference]:
     """Filter and normalize raw DOM anchors into compact references."""
     cap = _REFERENCE_CAPS.get(section_name, _DEFAULT_REFERENCE_CAP)
-    normalized_references: list[Reference] = []
-
-    for raw in raw_references:
-        normalized = normalize_reference(raw, section_name)
-        if normalized is None:
-            continue
-        normalized_references.append(normalized)
-
+    normalized_references = [
+        normalized
+        for raw in raw_references
+        if (normalized := normalize_reference(raw, section_name)) is not None
+    ]
     return dedupe_references(normalized_references, cap=cap)
 
 
@@ -271,14 +274,9 @@ def clean_label(value: str, kind: ReferenceKind) -> str | None:
     if not value:
         return None
 
-    value = re.sub(
-        r"^(?:View:\s*|View\b\s+|Open article:\s*)",
-        "",
-        value,
-        flags=re.IGNORECASE,
-    )
-    value = re.sub(r"[’']s\s+graphic link$", "", value, flags=re.IGNORECASE)
-    value = re.sub(r"\s+graphic link$", "", value, flags=re.IGNORECASE)
+    value = _LABEL_PREFIX_RE.sub("", value)
+    value = _POSSESSIVE_GRAPHIC_LINK_RE.sub("", value)
+    value = _GRAPHIC_LINK_RE.sub("", value)
     value = value.strip(" :-")
 
     if " by " in value and kind in {"article", "external"}:
@@ -302,7 +300,7 @@ def clean_label(value: str, kind: ReferenceKind) -> str | None:
         return None
     if len(value) > 80:
         return None
-    if not re.search(r"[A-Za-z0-9]", value):
+    if not _ALNUM_RE.search(value):
         return None
 
     return value
@@ -359,19 +357,20 @@ def dedupe_references(
     cap: int | None = None,
 ) -> list[Reference]:
     """Dedupe references by URL while keeping the cleaner duplicate in order."""
+    # Reassigning an existing key keeps its original position, so the dict
+    # alone preserves first-seen URL order.
     deduped: dict[str, Reference] = {}
-    ordered_urls: list[str] = []
 
     for reference in references:
         url = reference["url"]
         existing = deduped.get(url)
-        if existing is None:
-            deduped[url] = reference
-            ordered_urls.append(url)
-            continue
-        deduped[url] = _choose_better_reference(existing, reference)
+        deduped[url] = (
+            reference
+            if existing is None
+            else _choose_better_reference(existing, reference)
+        )
 
-    ordered = [deduped[url] for url in ordered_urls]
+    ordered = list(deduped.values())
     return ordered[:cap] if cap is not None else ordered
 
 
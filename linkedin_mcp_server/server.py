@@ -5,6 +5,7 @@ Creates and configures the MCP server with comprehensive LinkedIn tool suite inc
 person profiles, company data, job information, and session management capabilities.
 """
 
+import asyncio
 import logging
 from typing import Any, AsyncIterator
 
@@ -19,6 +20,7 @@ from linkedin_mcp_server.bootstrap import (
 from linkedin_mcp_server.constants import TOOL_TIMEOUT_SECONDS
 from linkedin_mcp_server.drivers.browser import close_browser
 from linkedin_mcp_server.error_handler import raise_tool_error
+from linkedin_mcp_server.scraping.cache import get_scrape_cache
 from linkedin_mcp_server.sequential_tool_middleware import (
     SequentialToolExecutionMiddleware,
 )
@@ -61,7 +63,7 @@ def create_mcp_server() -> FastMCP:
     register_job_tools(mcp)
     register_messaging_tools(mcp)
 
-    # Register session management tool
+    # Register session management tools
     @mcp.tool(
         timeout=TOOL_TIMEOUT_SECONDS,
         title="Close Session",
@@ -79,4 +81,22 @@ def create_mcp_server() -> FastMCP:
         except Exception as e:
             raise_tool_error(e, "close_session")  # NoReturn
 
+    @mcp.tool(
+        timeout=TOOL_TIMEOUT_SECONDS,
+        title="Clear Scrape Cache",
+        annotations={"destructiveHint": True},
+        tags={"session"},
+    )
+    async def clear_scrape_cache() -> dict[str, Any]:
+        """Drop cached profile, company, and job results so the next call re-scrapes."""
+        try:
+            # Waits for queued disk writes, so keep it off the event loop
+            cleared = await asyncio.to_thread(get_scrape_cache().clear)
+            return {
+                "status": "success",
+                "message": f"Cleared {cleared} cached scrape results",
+            }
+        except Exception as e:
+            raise_tool_error(e, "clear_scrape_cache")  # NoReturn
+
     return mcp
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 _SOURCE_STATE_FILE = "source-state.json"
 _RUNTIME_STATE_FILE = "runtime-state.json"
 _RUNTIME_PROFILES_DIR = "runtime-profiles"
+_SCRAPE_CACHE_FILE = "scrape-cache.sqlite3"
 
 
 @dataclass
@@ -69,6 +70,11 @@ def source_state_path(source_profile_dir: Path | None = None) -> Path:
     return auth_root_dir(source_profile_dir) / _SOURCE_STATE_FILE
 
 
+def scrape_cache_path(source_profile_dir: Path | None = None) -> Path:
+    """Return the on-disk scrape cache path used with --persist-scrape-cache."""
+    return auth_root_dir(source_profile_dir) / _SCRAPE_CACHE_FILE
+
+
 def runtime_profiles_root(source_profile_dir: Path | None = None) -> Path:
     """Return the root directory for derived runtime profiles."""
     return auth_root_dir(source_profile_dir) / _RUNTIME_PROFILES_DIR
@@ -295,6 +301,7 @@ def clear_auth_state(source_profile_dir: Path | None = None) -> bool:
         portable_cookie_path(profile_dir),
         source_state_path(profile_dir),
         runtime_profiles_root(profile_dir),
+        scrape_cache_path(profile_dir),
     ]
 
     success = True
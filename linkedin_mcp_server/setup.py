@@ -89,7 +89,7 @@ async def interactive_login(
         await asyncio.sleep(2)
 
         # Verify session cookie was persisted
-        cookies = await browser.context.cookies()
+        cookies = await browser.context.cookies("https://www.linkedin.com/")
         li_at = [c for c in cookies if c["name"] == "li_at"]
         if not li_at:
             print("   Warning: Session cookie not found. Login may not have persisted.")
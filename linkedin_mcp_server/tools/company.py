@@ -16,6 +16,12 @@ from linkedin_mcp_server.core.exceptions import AuthenticationError
 from linkedin_mcp_server.dependencies import get_ready_extractor, handle_auth_error
 from linkedin_mcp_server.error_handler import raise_tool_error
 from linkedin_mcp_server.scraping import parse_company_sections
+from linkedin_mcp_server.scraping.cache import (
+    COMPANY_TTL,
+    get_scrape_cache,
+    is_cacheable,
+    scrape_cache_key,
+)
 from linkedin_mcp_server.scraping.extractor import _RATE_LIMITED_MSG
 from linkedin_mcp_server.scraping.link_metadata import Reference
 
@@ -52,25 +58,33 @@ def register_company_tools(mcp: FastMCP) -> None:
 
         Returns:
             Dict with url, sections (name -> raw text), and optional references.
+            Includes rate_limited list naming sections LinkedIn blocked.
             Includes unknown_sections list when unrecognised names are passed.
             The LLM should parse the raw text in each section.
         """
         try:
-            extractor = extractor or await get_ready_extractor(
-                ctx, tool_name="get_company_profile"
-            )
             requested, unknown = parse_company_sections(sections)
-
-            logger.info(
-                "Scraping company: %s (sections=%s)",
-                company_name,
-                sections,
-            )
-
-            cb = MCPContextProgressCallback(ctx)
-            result = await extractor.scrape_company(
-                company_name, requested, callbacks=cb
-            )
+            cache = get_scrape_cache()
+            cache_key = scrape_cache_key("company", company_name, frozenset(requested))
+            result = cache.get(cache_key)
+
+            if result is None:
+                extractor = extractor or await get_ready_extractor(
+                    ctx, tool_name="get_company_profile"
+                )
+
+                logger.info(
+                    "Scraping company: %s (sections=%s)",
+                    company_name,
+                    sections,
+                )
+
+                cb = MCPContextProgressCallback(ctx)
+                result = await extractor.scrape_company(
+                    company_name, requested, callbacks=cb
+                )
+                if is_cacheable(result):
+                    cache.set(cache_key, result, ttl=COMPANY_TTL)
 
             if unknown:
                 result["unknown_sections"] = unknown
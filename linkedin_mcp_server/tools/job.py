@@ -14,6 +14,12 @@ from linkedin_mcp_server.constants import TOOL_TIMEOUT_SECONDS
 from linkedin_mcp_server.core.exceptions import AuthenticationError
 from linkedin_mcp_server.dependencies import get_ready_extractor, handle_auth_error
 from linkedin_mcp_server.error_handler import raise_tool_error
+from linkedin_mcp_server.scraping.cache import (
+    JOB_TTL,
+    get_scrape_cache,
+    is_cacheable,
+    scrape_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +51,12 @@ def register_job_tools(mcp: FastMCP) -> None:
             The LLM should parse the raw text to extract job details.
         """
         try:
+            cache = get_scrape_cache()
+            cache_key = scrape_cache_key("job", job_id)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             extractor = extractor or await get_ready_extractor(
                 ctx, tool_name="get_job_details"
             )
@@ -55,6 +67,8 @@ def register_job_tools(mcp: FastMCP) -> None:
             )
 
             result = await extractor.scrape_job(job_id)
+            if is_cacheable(result):
+                cache.set(cache_key, result, ttl=JOB_TTL)
 
             await ctx.report_progress(progress=100, total=100, message="Complete")
 
@@ -9,6 +9,7 @@ import logging
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
+from fastmcp.exceptions import ToolError
 from pydantic import Field
 
 from linkedin_mcp_server.callbacks import MCPContextProgressCallback
@@ -17,9 +18,19 @@ from linkedin_mcp_server.core.exceptions import AuthenticationError
 from linkedin_mcp_server.dependencies import get_ready_extractor, handle_auth_error
 from linkedin_mcp_server.error_handler import raise_tool_error
 from linkedin_mcp_server.scraping import parse_person_sections
+from linkedin_mcp_server.scraping.cache import (
+    PERSON_TTL,
+    get_scrape_cache,
+    is_cacheable,
+    scrape_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
+# Every profile section is its own page visit and the visits run sequentially,
+# so cap the batch by pages (usernames x sections) to stay within the timeout
+_MAX_BATCH_PAGES = 8
+
 
 def register_person_tools(mcp: FastMCP) -> None:
     """Register all person-related tools with the MCP server."""
@@ -36,6 +47,7 @@ def register_person_tools(mcp: FastMCP) -> None:
         ctx: Context,
         sections: str | None = None,
         max_scrolls: Annotated[int, Field(ge=1, le=50)] | None = None,
+        force_refresh: bool = False,
         extractor: Any | None = None,
     ) -> dict[str, Any]:
         """
@@ -57,32 +69,44 @@ def register_person_tools(mcp: FastMCP) -> None:
                 posts. Increase when a profile has many items in a section
                 (e.g., 30+ certifications, max_scrolls=20). To avoid slowing down
                 other sections, request heavy sections in a separate call.
+            force_refresh: Re-scrape even if a recent result is cached, e.g.
+                after the profile was edited. Default False.
 
         Returns:
             Dict with url, sections (name -> raw text), and optional references.
             Sections may be absent if extraction yielded no content for that page.
+            Includes rate_limited list naming sections LinkedIn blocked.
             Includes unknown_sections list when unrecognised names are passed.
             The LLM should parse the raw text in each section.
         """
         try:
-            extractor = extractor or await get_ready_extractor(
-                ctx, tool_name="get_person_profile"
-            )
             requested, unknown = parse_person_sections(sections)
-
-            logger.info(
-                "Scraping profile: %s (sections=%s)",
-                linkedin_username,
-                sections,
-            )
-
-            cb = MCPContextProgressCallback(ctx)
-            result = await extractor.scrape_person(
-                linkedin_username,
-                requested,
-                callbacks=cb,
-                max_scrolls=max_scrolls,
+            cache = get_scrape_cache()
+            cache_key = scrape_cache_key(
+                "person", linkedin_username, frozenset(requested), max_scrolls
             )
+            result = None if force_refresh else cache.get(cache_key)
+
+            if result is None:
+                extractor = extractor or await get_ready_extractor(
+                    ctx, tool_name="get_person_profile"
+                )
+
+                logger.info(
+                    "Scraping profile: %s (sections=%s)",
+                    linkedin_username,
+                    sections,
+                )
+
+                cb = MCPContextProgressCallback(ctx)
+                result = await extractor.scrape_person(
+                    linkedin_username,
+                    requested,
+                    callbacks=cb,
+                    max_scrolls=max_scrolls,
+                )
+                if is_cacheable(result):
+                    cache.set(cache_key, result, ttl=PERSON_TTL)
 
             if unknown:
                 result["unknown_sections"] = unknown
@@ -97,6 +121,119 @@ def register_person_tools(mcp: FastMCP) -> None:
         except Exception as e:
             raise_tool_error(e, "get_person_profile")  # NoReturn
 
+    @mcp.tool(
+        timeout=TOOL_TIMEOUT_SECONDS,
+        title="Get Person Profiles",
+        annotations={"readOnlyHint": True, "openWorldHint": True},
+        tags={"person", "scraping"},
+        exclude_args=["extractor"],
+    )
+    async def get_person_profiles(
+        linkedin_usernames: Annotated[
+            list[str], Field(min_length=1, max_length=_MAX_BATCH_PAGES)
+        ],
+        ctx: Context,
+        sections: str | None = None,
+        max_scrolls: Annotated[int, Field(ge=1, le=50)] | None = None,
+        force_refresh: bool = False,
+        extractor: Any | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get several LinkedIn profiles in one call.
+
+        Profiles are scraped one after another in the shared browser session,
+        so this saves tool round trips rather than browser time. Cached
+        profiles are returned without visiting LinkedIn again, and each
+        profile is cached as soon as it is scraped, so retrying a batch that
+        failed partway only visits the remaining profiles.
+
+        Args:
+            linkedin_usernames: LinkedIn usernames (e.g., ["stickerdaniel", "williamhgates"]).
+                Each username costs one page per section (main profile included),
+                and a batch may visit at most 8 pages, e.g. 8 main profiles or
+                4 profiles with one extra section.
+            ctx: FastMCP context for progress reporting
+            sections: Comma-separated list of extra sections to scrape for every
+                profile. Same values as get_person_profile.
+            max_scrolls: Maximum pagination attempts per section, as in
+                get_person_profile.
+            force_refresh: Skip cached results and scrape every profile again.
+
+        Returns:
+            Dict with profiles, a list of get_person_profile results in input order.
+            Includes unknown_sections list when unrecognised names are passed.
+        """
+        requested, unknown = parse_person_sections(sections)
+        pages = len(linkedin_usernames) * len(requested)
+        if pages > _MAX_BATCH_PAGES:
+            raise ToolError(
+                f"This batch would visit {pages} pages ({len(linkedin_usernames)} "
+                f"profiles x {len(requested)} sections), more than the "
+                f"{_MAX_BATCH_PAGES} that fit in one call. Split it into "
+                "smaller batches or request fewer sections."
+            )
+
+        try:
+            cache = get_scrape_cache()
+            cache_keys = [
+                scrape_cache_key("person", username, frozenset(requested), max_scrolls)
+                for username in linkedin_usernames
+            ]
+            profiles = [None if force_refresh else cache.get(key) for key in cache_keys]
+            # Usernames that normalize to the same key are scraped only once
+            missing: dict[tuple, list[int]] = {}
+            for i, profile in enumerate(profiles):
+                if profile is None:
+                    missing.setdefault(cache_keys[i], []).append(i)
+
+            if missing:
+                extractor = extractor or await get_ready_extractor(
+                    ctx, tool_name="get_person_profiles"
+                )
+                logger.info(
+                    "Scraping %d of %d profiles (sections=%s)",
+                    len(missing),
+                    len(linkedin_usernames),
+                    sections,
+                )
+                pending = list(missing.items())
+                await ctx.report_progress(
+                    progress=0, total=len(pending), message="Scraping profiles"
+                )
+
+                async def store(position: int, profile: dict[str, Any]) -> None:
+                    key, indices = pending[position]
+                    for i in indices:
+                        profiles[i] = profile
+                    if is_cacheable(profile):
+                        cache.set(key, profile, ttl=PERSON_TTL)
+                    await ctx.report_progress(
+                        progress=position + 1,
+                        total=len(pending),
+                        message=f"Scraped {linkedin_usernames[indices[0]]}",
+                    )
+
+                await extractor.scrape_people(
+                    [linkedin_usernames[indices[0]] for _, indices in pending],
+                    requested,
+                    max_scrolls=max_scrolls,
+                    on_result=store,
+                )
+
+            result: dict[str, Any] = {"profiles": profiles}
+            if unknown:
+                result["unknown_sections"] = unknown
+
+            return result
+
+        except AuthenticationError as e:
+            try:
+                await handle_auth_error(e, ctx)
+            except Exception as relogin_exc:
+                raise_tool_error(relogin_exc, "get_person_profiles")
+        except Exception as e:
+            raise_tool_error(e, "get_person_profiles")  # NoReturn
+
     @mcp.tool(
         timeout=TOOL_TIMEOUT_SECONDS,
         title="Search People",
@@ -7,14 +7,17 @@ def reset_singletons():
     from linkedin_mcp_server.bootstrap import reset_bootstrap_for_testing
     from linkedin_mcp_server.config import reset_config
     from linkedin_mcp_server.drivers.browser import reset_browser_for_testing
+    from linkedin_mcp_server.scraping.cache import reset_scrape_cache_for_testing
 
     reset_bootstrap_for_testing()
     reset_browser_for_testing()
     reset_config()
+    reset_scrape_cache_for_testing()
     yield
     reset_bootstrap_for_testing()
     reset_browser_for_testing()
     reset_config()
+    reset_scrape_cache_for_testing()
 
 
 @pytest.fixture(autouse=True)
@@ -10,6 +10,7 @@ from linkedin_mcp_server.authentication import (
 from linkedin_mcp_server.drivers.browser import profile_exists
 from linkedin_mcp_server.exceptions import CredentialsNotFoundError
 from linkedin_mcp_server.session_state import (
+    scrape_cache_path,
     portable_cookie_path,
     runtime_profile_dir,
     runtime_storage_state_path,
@@ -108,3 +109,11 @@ def test_clear_auth_state_removes_source_and_runtime_files(profile_dir):
     assert not portable_cookie_path(profile_dir).exists()
     assert not source_state_path(profile_dir).exists()
     assert not runtime_profile_dir("linux-amd64-container", profile_dir).exists()
+
+
+def test_clear_auth_state_removes_persisted_scrape_cache(profile_dir):
+    cache_file = scrape_cache_path(profile_dir)
+    cache_file.write_text("")
+
+    assert clear_auth_state(profile_dir) is True
+    assert not cache_file.exists()
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 from unittest.mock import MagicMock
@@ -24,8 +25,14 @@ from linkedin_mcp_server.exceptions import (
     BrowserSetupInProgressError,
     DockerHostLoginRequiredError,
 )
+from linkedin_mcp_server.scraping.cache import (
+    enable_persistent_scrape_cache,
+    get_scrape_cache,
+    ScrapeCache,
+)
 from linkedin_mcp_server.session_state import (
     portable_cookie_path,
+    scrape_cache_path,
     source_state_path,
 )
 
@@ -98,6 +105,35 @@ class TestBootstrap:
         with pytest.raises(DockerHostLoginRequiredError):
             await ensure_tool_ready_or_raise("search_jobs")
 
+    async def test_ready_gate_is_cached_briefly(self, monkeypatch):
+        auth_checks = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "linkedin_mcp_server.bootstrap.browser_setup_ready", lambda: True
+        )
+        monkeypatch.setattr("linkedin_mcp_server.bootstrap._auth_ready", auth_checks)
+
+        initialize_bootstrap("managed")
+        await ensure_tool_ready_or_raise("get_person_profile")
+        await ensure_tool_ready_or_raise("search_jobs")
+
+        assert auth_checks.call_count == 1
+
+    async def test_ready_gate_rechecks_after_ttl(self, monkeypatch):
+        auth_checks = MagicMock(return_value=True)
+        monkeypatch.setattr(
+            "linkedin_mcp_server.bootstrap.browser_setup_ready", lambda: True
+        )
+        monkeypatch.setattr("linkedin_mcp_server.bootstrap._auth_ready", auth_checks)
+
+        initialize_bootstrap("managed")
+        await ensure_tool_ready_or_raise("get_person_profile")
+        state = get_bootstrap_state()
+        assert state.ready_checked_at is not None
+        state.ready_checked_at -= 10.0
+        await ensure_tool_ready_or_raise("search_jobs")
+
+        assert auth_checks.call_count == 2
+
     def test_reset_bootstrap_clears_state(self):
         initialize_bootstrap("managed")
         reset_bootstrap_for_testing()
@@ -223,3 +259,16 @@ class TestInvalidateAuthAndTriggerRelogin:
         assert not isolate_profile_dir.exists()
         assert not portable_cookie_path(isolate_profile_dir).exists()
         assert not source_state_path(isolate_profile_dir).exists()
+
+    async def test_move_aside_clears_persisted_scrape_cache(self, isolate_profile_dir):
+        """Results scraped under the discarded session must not be served again."""
+        _make_auth_ready(isolate_profile_dir)
+        path = scrape_cache_path(isolate_profile_dir)
+        enable_persistent_scrape_cache(path)
+        get_scrape_cache().set(("person", "alice"), {"sections": {"a": "b"}}, ttl=60)
+
+        # Same worker-thread path the relogin flow uses
+        await asyncio.to_thread(_force_move_auth_state_aside)
+
+        assert get_scrape_cache().get(("person", "alice")) is None
+        assert ScrapeCache(path=path).get(("person", "alice")) is None
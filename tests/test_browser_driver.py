@@ -1,5 +1,6 @@
 """Tests for linkedin_mcp_server.drivers.browser runtime-aware auth startup."""
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -148,6 +149,39 @@ async def test_same_runtime_uses_source_profile(tmp_path):
     source_browser.import_cookies.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_browser_launch(tmp_path):
+    _write_source_state(tmp_path, runtime_id="macos-arm64-host")
+    source_browser = _make_mock_browser()
+
+    async def slow_start() -> None:
+        await asyncio.sleep(0.01)
+
+    source_browser.start = AsyncMock(side_effect=slow_start)
+
+    with (
+        patch(
+            "linkedin_mcp_server.drivers.browser.get_runtime_id",
+            return_value="macos-arm64-host",
+        ),
+        patch(
+            "linkedin_mcp_server.drivers.browser.BrowserManager",
+            return_value=source_browser,
+        ) as ctor,
+        patch(
+            "linkedin_mcp_server.drivers.browser.detect_auth_barrier_quick",
+            new_callable=AsyncMock,
+            return_value=None,
+        ),
+    ):
+        first, second = await asyncio.gather(
+            get_or_create_browser(), get_or_create_browser()
+        )
+
+    assert first is second is source_browser
+    ctor.assert_called_once()
+
+
 @pytest.mark.asyncio
 async def test_same_runtime_clicks_remember_me_during_feed_validation(tmp_path):
     _write_source_state(tmp_path, runtime_id="macos-arm64-host")
@@ -43,7 +43,7 @@ def test_main_non_interactive_stdio_has_no_human_stdout(
     )
     _patch_main_dependencies(monkeypatch, config)
     mcp = MagicMock()
-    monkeypatch.setattr("linkedin_mcp_server.cli_main.create_mcp_server", lambda: mcp)
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
 
     cli_main.main()
 
@@ -52,6 +52,38 @@ def test_main_non_interactive_stdio_has_no_human_stdout(
     assert captured.out == ""
 
 
+def test_main_persists_scrape_cache_only_for_server_runtime(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    config = _make_config(
+        is_interactive=False, transport="stdio", transport_explicitly_set=False
+    )
+    config.server.persist_scrape_cache = True
+    config.server.logout = True
+    _patch_main_dependencies(monkeypatch, config)
+    enable = MagicMock()
+    monkeypatch.setattr(
+        "linkedin_mcp_server.cli_main.enable_persistent_scrape_cache", enable
+    )
+    monkeypatch.setattr(
+        "linkedin_mcp_server.cli_main.clear_profile_and_exit",
+        MagicMock(side_effect=SystemExit(0)),
+    )
+
+    with pytest.raises(SystemExit):
+        cli_main.main()
+    enable.assert_not_called()
+
+    config.server.logout = False
+    mcp = MagicMock()
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
+
+    cli_main.main()
+
+    enable.assert_called_once()
+    mcp.run.assert_called_once_with(transport="stdio")
+
+
 def test_main_interactive_prompts_when_transport_not_explicit(
     monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -64,7 +96,7 @@ def test_main_interactive_prompts_when_transport_not_explicit(
         "linkedin_mcp_server.cli_main.choose_transport_interactive", choose_transport
     )
     mcp = MagicMock()
-    monkeypatch.setattr("linkedin_mcp_server.cli_main.create_mcp_server", lambda: mcp)
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
 
     cli_main.main()
 
@@ -91,7 +123,7 @@ def test_main_explicit_transport_skips_prompt(
         "linkedin_mcp_server.cli_main.choose_transport_interactive", choose_transport
     )
     mcp = MagicMock()
-    monkeypatch.setattr("linkedin_mcp_server.cli_main.create_mcp_server", lambda: mcp)
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
 
     cli_main.main()
 
@@ -114,7 +146,7 @@ def test_main_streamable_http_passes_host_port_path(
     config.server.path = "/custom-mcp"
     _patch_main_dependencies(monkeypatch, config)
     mcp = MagicMock()
-    monkeypatch.setattr("linkedin_mcp_server.cli_main.create_mcp_server", lambda: mcp)
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
 
     cli_main.main()
 
@@ -153,7 +185,7 @@ def test_main_non_interactive_no_auth_still_starts_server(
     )
     _patch_main_dependencies(monkeypatch, config)
     mcp = MagicMock()
-    monkeypatch.setattr("linkedin_mcp_server.cli_main.create_mcp_server", lambda: mcp)
+    monkeypatch.setattr("linkedin_mcp_server.server.create_mcp_server", lambda: mcp)
 
     cli_main.main()
 
@@ -323,3 +355,54 @@ def test_clear_profile_and_exit_clears_all_auth_state(
     assert cleared["profile"] == profile_dir
     captured = capsys.readouterr()
     assert "authentication state cleared" in captured.out.lower()
+
+
+def test_clear_profile_and_exit_clears_scrape_cache_without_auth_state(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+) -> None:
+    config = AppConfig()
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.get_config", lambda: config)
+    monkeypatch.setattr(
+        "linkedin_mcp_server.cli_main.configure_logging", lambda **_kwargs: None
+    )
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.get_version", lambda: "4.0.0")
+    monkeypatch.setattr(
+        "linkedin_mcp_server.cli_main.get_profile_dir", lambda: tmp_path / "profile"
+    )
+    monkeypatch.setattr("builtins.input", lambda _prompt="": "y")
+    (tmp_path / "scrape-cache.sqlite3").write_text("")
+    clear = MagicMock(return_value=True)
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.clear_auth_state", clear)
+
+    with pytest.raises(SystemExit) as exit_info:
+        cli_main.clear_profile_and_exit()
+
+    assert exit_info.value.code == 0
+    clear.assert_called_once_with(tmp_path / "profile")
+
+
+def test_exit_gracefully_skips_cleanup_without_browser(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.has_browser", lambda: False)
+    run = MagicMock()
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.asyncio.run", run)
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main.exit_gracefully(0)
+
+    assert exc_info.value.code == 0
+    run.assert_not_called()
+
+
+def test_exit_gracefully_closes_open_browser(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.has_browser", lambda: True)
+    close = AsyncMock()
+    monkeypatch.setattr("linkedin_mcp_server.cli_main.close_browser", close)
+
+    with pytest.raises(SystemExit) as exc_info:
+        cli_main.exit_gracefully(1)
+
+    assert exc_info.value.code == 1
+    close.assert_awaited_once()
@@ -201,6 +201,22 @@ class TestLoaders:
         with pytest.raises(ConfigurationError, match="Invalid VIEWPORT"):
             load_from_env(AppConfig())
 
+    def test_load_from_env_persist_scrape_cache(self, monkeypatch):
+        monkeypatch.setenv("PERSIST_SCRAPE_CACHE", " Yes ")
+        from linkedin_mcp_server.config.loaders import load_from_env
+
+        config = load_from_env(AppConfig())
+        assert config.server.persist_scrape_cache is True
+
+    def test_persist_scrape_cache_flag(self, monkeypatch):
+        monkeypatch.setattr(
+            "sys.argv", ["linkedin-mcp-server", "--persist-scrape-cache"]
+        )
+        from linkedin_mcp_server.config.loaders import load_from_args
+
+        config = load_from_args(AppConfig())
+        assert config.server.persist_scrape_cache is True
+
     def test_load_from_env_user_data_dir(self, monkeypatch):
         monkeypatch.setenv("USER_DATA_DIR", "/custom/profile")
         from linkedin_mcp_server.config.loaders import load_from_env
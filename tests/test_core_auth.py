@@ -106,6 +106,21 @@ async def test_is_logged_in_accepts_authenticated_only_page_with_content():
     assert result is True
 
 
+@pytest.mark.asyncio
+async def test_is_logged_in_checks_nav_markup_in_one_locator():
+    page = MagicMock()
+    page.url = "https://www.linkedin.com/in/someone/"
+    page.locator.return_value.count = AsyncMock(return_value=1)
+
+    result = await is_logged_in(page)
+
+    assert result is True
+    page.locator.assert_called_once()
+    selector = page.locator.call_args.args[0]
+    assert ".global-nav__primary-link" in selector
+    assert 'nav a[href*="/feed"]' in selector
+
+
 @pytest.mark.asyncio
 async def test_detect_auth_barrier_ignores_continue_as_in_page_content():
     page = MagicMock()
@@ -161,3 +161,27 @@ async def test_close_is_idempotent_and_resets_state(tmp_path):
     assert browser._context is None
     assert browser._page is None
     assert browser._playwright is None
+
+
+@pytest.mark.asyncio
+async def test_set_cookie_requires_context(tmp_path):
+    browser = BrowserManager(user_data_dir=tmp_path / "profile")
+
+    with pytest.raises(RuntimeError, match="context not initialized"):
+        await browser.set_cookie("li_at", "token")
+
+
+@pytest.mark.asyncio
+async def test_export_cookies_requests_linkedin_cookies_only(tmp_path):
+    browser, context = _make_browser_manager(tmp_path)
+    context.cookies = AsyncMock(
+        return_value=[_make_cookie("li_at", domain=".www.linkedin.com")]
+    )
+    cookie_path = tmp_path / "cookies.json"
+
+    assert await browser.export_cookies(cookie_path) is True
+
+    requested_urls = context.cookies.await_args.args[0]
+    assert all("linkedin.com" in url for url in requested_urls)
+    exported = json.loads(cookie_path.read_text())
+    assert exported == [_make_cookie("li_at", domain=".linkedin.com")]
@@ -5,7 +5,11 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from linkedin_mcp_server.core.exceptions import RateLimitError
-from linkedin_mcp_server.core.utils import detect_rate_limit
+from linkedin_mcp_server.core.utils import (
+    detect_rate_limit,
+    handle_modal_close,
+    scroll_to_bottom,
+)
 
 
 @pytest.fixture
@@ -109,3 +113,37 @@ class TestDetectRateLimit:
 
         mock_page.locator = MagicMock(side_effect=locator_side_effect)
         await detect_rate_limit(mock_page)
+
+
+class TestScrollToBottom:
+    async def test_scrolls_in_single_evaluate(self, mock_page):
+        mock_page.evaluate = AsyncMock(return_value=3)
+
+        await scroll_to_bottom(mock_page, pause_time=0.5, max_scrolls=7)
+
+        mock_page.evaluate.assert_awaited_once()
+        _, arg = mock_page.evaluate.call_args.args
+        assert arg == {"pauseTime": 0.5, "maxScrolls": 7}
+
+
+class TestHandleModalClose:
+    async def test_waits_for_dismiss_button_to_hide(self, mock_page):
+        close_button = MagicMock()
+        close_button.is_visible = AsyncMock(return_value=True)
+        close_button.click = AsyncMock()
+        close_button.wait_for = AsyncMock()
+        mock_page.locator.return_value.first = close_button
+
+        assert await handle_modal_close(mock_page) is True
+
+        close_button.click.assert_awaited_once()
+        close_button.wait_for.assert_awaited_once_with(state="hidden", timeout=500)
+
+    async def test_no_visible_modal_returns_false(self, mock_page):
+        close_button = MagicMock()
+        close_button.is_visible = AsyncMock(return_value=False)
+        close_button.click = AsyncMock()
+        mock_page.locator.return_value.first = close_button
+
+        assert await handle_modal_close(mock_page) is False
+        close_button.click.assert_not_awaited()
@@ -0,0 +1,173 @@
+import os
+import sqlite3
+import threading
+from unittest.mock import patch
+
+from linkedin_mcp_server.scraping.cache import (
+    ScrapeCache,
+    enable_persistent_scrape_cache,
+    get_scrape_cache,
+    is_cacheable,
+    scrape_cache_key,
+)
+from linkedin_mcp_server.server import create_mcp_server
+
+
+class TestScrapeCache:
+    def test_get_returns_stored_value(self):
+        cache = ScrapeCache()
+        cache.set("k", {"sections": {"main_profile": "x"}}, ttl=60)
+        assert cache.get("k") == {"sections": {"main_profile": "x"}}
+
+    def test_entries_expire_after_ttl(self):
+        cache = ScrapeCache()
+        with patch(
+            "linkedin_mcp_server.scraping.cache.time.monotonic", return_value=100.0
+        ):
+            cache.set("k", {"sections": {}}, ttl=10)
+        with patch(
+            "linkedin_mcp_server.scraping.cache.time.monotonic", return_value=110.0
+        ):
+            assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = ScrapeCache(maxsize=2)
+        cache.set("a", {"v": 1}, ttl=60)
+        cache.set("b", {"v": 2}, ttl=60)
+        cache.get("a")
+        cache.set("c", {"v": 3}, ttl=60)
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+
+    def test_returned_value_is_isolated_from_cache(self):
+        cache = ScrapeCache()
+        cache.set("k", {"sections": {"main_profile": "x"}}, ttl=60)
+        first = cache.get("k")
+        assert first is not None
+        first["unknown_sections"] = ["bogus"]
+        assert cache.get("k") == {"sections": {"main_profile": "x"}}
+
+
+class TestPersistentScrapeCache:
+    def test_entries_survive_a_new_instance(self, tmp_path):
+        path = tmp_path / "cache" / "scrape-cache.sqlite3"
+        key = scrape_cache_key("person", "alice", frozenset({"b", "a"}), None)
+        cache = ScrapeCache(path=path)
+        cache.set(key, {"sections": {"main_profile": "x"}}, ttl=60)
+        cache.flush()
+
+        reopened = ScrapeCache(path=path)
+
+        assert reopened.get(key) == {"sections": {"main_profile": "x"}}
+        assert len(reopened) == 1
+        assert path.stat().st_mode & 0o777 == 0o600
+
+    def test_expired_disk_entries_are_ignored(self, tmp_path):
+        path = tmp_path / "scrape-cache.sqlite3"
+        with patch("linkedin_mcp_server.scraping.cache.time.time", return_value=100.0):
+            cache = ScrapeCache(path=path)
+            cache.set("k", {"sections": {}}, ttl=10)
+            cache.flush()
+        with patch("linkedin_mcp_server.scraping.cache.time.time", return_value=110.0):
+            assert ScrapeCache(path=path).get("k") is None
+
+    def test_clear_removes_disk_entries(self, tmp_path):
+        path = tmp_path / "scrape-cache.sqlite3"
+        cache = ScrapeCache(path=path)
+        cache.set("a", {"v": 1}, ttl=60)
+        cache.set("b", {"v": 2}, ttl=60)
+        cache.flush()
+
+        assert ScrapeCache(path=path).clear() == 2
+        assert ScrapeCache(path=path).get("a") is None
+
+    def test_file_is_private_from_creation(self, tmp_path):
+        path = tmp_path / "scrape-cache.sqlite3"
+        connect_modes = []
+
+        def connect(target, *args, **kwargs):
+            connect_modes.append(os.stat(target).st_mode & 0o777)
+            return real_connect(target, *args, **kwargs)
+
+        real_connect = sqlite3.connect
+        with (
+            patch("linkedin_mcp_server.scraping.cache.sqlite3.connect", connect),
+            patch("linkedin_mcp_server.scraping.cache.os.chmod"),
+        ):
+            ScrapeCache(path=path)
+
+        assert connect_modes == [0o600]
+
+    def test_writes_do_not_block_the_caller(self, tmp_path):
+        """set() returns before the row is committed on the writer thread."""
+        cache = ScrapeCache(path=tmp_path / "scrape-cache.sqlite3")
+        release = threading.Event()
+        cache._writer.submit(release.wait)
+
+        cache.set("k", {"v": 1}, ttl=60)
+
+        assert cache.get("k") == {"v": 1}
+        release.set()
+        cache.flush()
+        assert ScrapeCache(path=tmp_path / "scrape-cache.sqlite3").get("k") == {"v": 1}
+
+    def test_unusable_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = ScrapeCache(path=blocker / "scrape-cache.sqlite3")
+
+        cache.set("k", {"v": 1}, ttl=60)
+
+        assert cache.get("k") == {"v": 1}
+
+    def test_enable_replaces_process_cache(self, tmp_path):
+        enable_persistent_scrape_cache(tmp_path / "scrape-cache.sqlite3")
+        get_scrape_cache().set("k", {"v": 1}, ttl=60)
+        get_scrape_cache().flush()
+
+        assert ScrapeCache(path=tmp_path / "scrape-cache.sqlite3").get("k") == {"v": 1}
+
+
+class TestIsCacheable:
+    def test_complete_result_is_cacheable(self):
+        assert is_cacheable({"sections": {"main_profile": "x"}})
+
+    def test_empty_sections_not_cacheable(self):
+        assert not is_cacheable({"sections": {}})
+
+    def test_rate_limited_sections_not_cacheable(self):
+        assert not is_cacheable(
+            {"sections": {"main_profile": "x"}, "rate_limited": ["experience"]}
+        )
+
+    def test_section_errors_not_cacheable(self):
+        assert not is_cacheable(
+            {"sections": {"main_profile": "x"}, "section_errors": {"posts": "boom"}}
+        )
+
+
+class TestScrapeCacheKey:
+    def test_folds_case_whitespace_and_slashes(self):
+        assert scrape_cache_key("person", " /Bill-Gates/ ") == scrape_cache_key(
+            "person", "bill-gates"
+        )
+
+    def test_kinds_do_not_collide(self):
+        assert scrape_cache_key("person", "acme") != scrape_cache_key("company", "acme")
+
+
+class TestClearScrapeCacheTool:
+    async def test_clears_cached_results(self):
+        cache = get_scrape_cache()
+        cache.set(scrape_cache_key("job", "123"), {"sections": {"x": "y"}}, ttl=60)
+        mcp = create_mcp_server()
+
+        result = await mcp.call_tool("clear_scrape_cache", {})
+
+        assert result.structured_content == {
+            "status": "success",
+            "message": "Cleared 1 cached scrape results",
+        }
+        assert len(cache) == 0
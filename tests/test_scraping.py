@@ -16,6 +16,8 @@ from linkedin_mcp_server.scraping.connection import (
 from linkedin_mcp_server.scraping.extractor import (
     ExtractedSection,
     LinkedInExtractor,
+    _EMPTY_ACTIVITY_TEXTS,
+    _EMPTY_SEARCH_TEXTS,
     _RATE_LIMITED_MSG,
     _truncate_linkedin_noise,
     strip_linkedin_noise,
@@ -294,6 +296,24 @@ class TestExtractPage:
         # goto called twice (initial + retry)
         assert mock_page.goto.await_count == 2
 
+    async def test_overlay_isolates_unexpected_errors(self, mock_page):
+        """Overlay extraction shares the retry wrapper's error isolation."""
+        extractor = LinkedInExtractor(mock_page)
+        with patch.object(
+            extractor,
+            "_extract_overlay_once",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("dialog detached"),
+        ):
+            result = await extractor._extract_overlay(
+                "https://www.linkedin.com/in/testuser/overlay/contact-info/",
+                section_name="contact_info",
+            )
+
+        assert result.text == ""
+        assert result.error is not None
+        assert result.error["context"] == "extract_overlay"
+
     async def test_retry_succeeds_after_rate_limit(self, mock_page):
         """When first attempt is rate-limited but retry succeeds, return content."""
         noise_only = "More profiles for you\n\nAbout\nAccessibility\nTalent Solutions"
@@ -539,6 +559,29 @@ class TestNavigationDiagnostics:
         mock_page.on.assert_called_once()
         mock_page.remove_listener.assert_called_once()
 
+    async def test_log_navigation_failure_tolerates_probe_errors(
+        self, mock_page, caplog
+    ):
+        extractor = LinkedInExtractor(mock_page)
+        mock_page.title = AsyncMock(side_effect=Exception("page closed"))
+        mock_page.evaluate = AsyncMock(return_value="Sign in  to\ncontinue")
+
+        with patch(
+            "linkedin_mcp_server.scraping.extractor.detect_auth_barrier",
+            new_callable=AsyncMock,
+            side_effect=Exception("detached"),
+        ):
+            await extractor._log_navigation_failure(
+                "https://www.linkedin.com/in/testuser/",
+                "domcontentloaded",
+                Exception("boom"),
+                [],
+            )
+
+        assert "title=''" in caplog.text
+        assert "auth_barrier=None" in caplog.text
+        assert "body_marker='Sign in to continue'" in caplog.text
+
 
 class TestScrapePersonUrls:
     """Test that scrape_person visits the correct URLs per section set."""
@@ -840,6 +883,80 @@ class TestScrapePersonUrls:
             assert call.kwargs.get("max_scrolls") == 15
 
 
+class TestScrapePeople:
+    async def test_scrapes_each_username_in_order(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        with (
+            patch.object(
+                extractor,
+                "extract_page",
+                new_callable=AsyncMock,
+                return_value=extracted("text"),
+            ) as mock_extract,
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            results = await extractor.scrape_people(["alice", "bob"], {"main_profile"})
+
+        assert [r["url"] for r in results] == [
+            "https://www.linkedin.com/in/alice/",
+            "https://www.linkedin.com/in/bob/",
+        ]
+        assert mock_extract.await_count == 2
+        mock_sleep.assert_awaited_once()
+
+    async def test_auth_error_aborts_batch(self, mock_page):
+        extractor = LinkedInExtractor(mock_page)
+        with (
+            patch.object(
+                extractor,
+                "scrape_person",
+                new_callable=AsyncMock,
+                side_effect=AuthenticationError("expired"),
+            ) as mock_scrape,
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+            pytest.raises(AuthenticationError),
+        ):
+            await extractor.scrape_people(["alice", "bob"], {"main_profile"})
+
+        mock_scrape.assert_awaited_once()
+
+    async def test_on_result_sees_profiles_finished_before_abort(self, mock_page):
+        from linkedin_mcp_server.core.exceptions import RateLimitError
+
+        extractor = LinkedInExtractor(mock_page)
+        seen: list[tuple[int, dict]] = []
+
+        async def on_result(i: int, result: dict) -> None:
+            seen.append((i, result))
+
+        with (
+            patch.object(
+                extractor,
+                "scrape_person",
+                new_callable=AsyncMock,
+                side_effect=[{"url": "alice"}, RateLimitError("slow down")],
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+            pytest.raises(RateLimitError),
+        ):
+            await extractor.scrape_people(
+                ["alice", "bob"],
+                {"main_profile"},
+                on_result=on_result,
+            )
+
+        assert seen == [(0, {"url": "alice"})]
+
+
 class TestDetectConnectionState:
     """Tests for connection state detection from profile text."""
 
@@ -1139,6 +1256,7 @@ class TestConnectWithPerson:
 
         assert "main_profile" not in result["sections"]
         assert result["sections"]["posts"] == "Post text"
+        assert result["rate_limited"] == ["main_profile"]
 
 
 class TestScrapeCompany:
@@ -1232,6 +1350,7 @@ class TestScrapeCompany:
 
         assert "about" not in result["sections"]
         assert result["sections"]["posts"] == "Posts text"
+        assert result["rate_limited"] == ["about"]
 
 
 class TestScrapeJob:
@@ -1864,6 +1983,29 @@ class TestStripLinkedInNoise:
 class TestActivityFeedExtraction:
     """Tests for activity page detection and wait behavior in _extract_page_once."""
 
+    async def test_main_text_wait_ignores_empty_states_by_default(self, mock_page):
+        """Only callers that opt in stop early on empty-state text."""
+        mock_page.wait_for_function = AsyncMock()
+        extractor = LinkedInExtractor(mock_page)
+
+        await extractor._wait_for_main_text(log_context="Messaging inbox")
+
+        assert mock_page.wait_for_function.call_args.kwargs["arg"] == {
+            "minimumLength": 100,
+            "emptyStateTexts": [],
+        }
+
+    def test_empty_state_texts_match_lowercased_page_text(self):
+        """The wait lowercases main's text, so markers must match that form."""
+        assert any(
+            marker in "Bill Gates hasn’t posted yet".lower()
+            for marker in _EMPTY_ACTIVITY_TEXTS
+        )
+        assert any(
+            marker in "No results found\nTry shortening your search".lower()
+            for marker in _EMPTY_SEARCH_TEXTS
+        )
+
     async def test_activity_page_waits_for_content_and_uses_slow_scroll(
         self, mock_page
     ):
@@ -1898,6 +2040,11 @@ class TestActivityFeedExtraction:
             )
 
         mock_page.wait_for_function.assert_awaited_once()
+        # Empty feeds resolve the wait early instead of timing out
+        assert mock_page.wait_for_function.call_args.kwargs["arg"] == {
+            "minimumLength": 200,
+            "emptyStateTexts": list(_EMPTY_ACTIVITY_TEXTS),
+        }
         mock_scroll.assert_awaited_once()
         _, kwargs = mock_scroll.call_args
         assert kwargs["pause_time"] == 1.0
@@ -2097,6 +2244,65 @@ class TestActivityFeedExtraction:
 
         assert show_more.click.await_count == 2
 
+    async def test_details_page_show_more_waits_for_content_change(self, mock_page):
+        """After each click the loop polls main's text length instead of sleeping."""
+
+        async def evaluate_side_effect(script, *args):
+            if "innerText.length" in script:
+                return 1234
+            return {"source": "root", "text": "text", "references": []}
+
+        mock_page.evaluate = AsyncMock(side_effect=evaluate_side_effect)
+        mock_page.wait_for_function = AsyncMock()
+
+        show_more = MagicMock()
+        show_more.count = AsyncMock(side_effect=[1, 0])
+        show_more.is_visible = AsyncMock(return_value=True)
+        show_more.scroll_into_view_if_needed = AsyncMock()
+        show_more.click = AsyncMock()
+        show_more.first = show_more
+        show_more.filter = MagicMock(return_value=show_more)
+
+        def locator_side_effect(selector):
+            if selector == "main button":
+                return show_more
+            return MagicMock(count=AsyncMock(return_value=0))
+
+        mock_page.locator = MagicMock(side_effect=locator_side_effect)
+        extractor = LinkedInExtractor(mock_page)
+
+        with (
+            patch(
+                "linkedin_mcp_server.scraping.extractor.scroll_to_bottom",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.detect_rate_limit",
+                new_callable=AsyncMock,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.handle_modal_close",
+                new_callable=AsyncMock,
+                return_value=False,
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ) as mock_sleep,
+        ):
+            await extractor._extract_page_once(
+                "https://www.linkedin.com/in/billgates/details/certifications/",
+                section_name="certifications",
+            )
+
+        mock_sleep.assert_not_awaited()
+        change_waits = [
+            call
+            for call in mock_page.wait_for_function.call_args_list
+            if call.kwargs.get("arg") == {"previousLength": 1234}
+        ]
+        assert len(change_waits) == 1
+
     async def test_details_page_show_more_respects_max_scrolls_budget(self, mock_page):
         """When 'Show more' never disappears, loop exits after max_scrolls clicks."""
         mock_page.evaluate = AsyncMock(
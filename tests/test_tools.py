@@ -1,5 +1,5 @@
 from typing import Any, Callable, Coroutine, cast
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastmcp import FastMCP
@@ -23,6 +23,19 @@ def _make_mock_extractor(scrape_result: dict) -> MagicMock:
     """Create a mock LinkedInExtractor that returns the given result."""
     mock = MagicMock()
     mock.scrape_person = AsyncMock(return_value=scrape_result)
+
+    async def scrape_people(usernames, requested, max_scrolls=None, on_result=None):
+        results = []
+        for i, username in enumerate(usernames):
+            result = await mock.scrape_person(
+                username, requested, max_scrolls=max_scrolls
+            )
+            if on_result is not None:
+                await on_result(i, result)
+            results.append(result)
+        return results
+
+    mock.scrape_people = AsyncMock(side_effect=scrape_people)
     mock.connect_with_person = AsyncMock(return_value=scrape_result)
     mock.scrape_company = AsyncMock(return_value=scrape_result)
     mock.scrape_job = AsyncMock(return_value=scrape_result)
@@ -113,6 +126,283 @@ class TestPersonTool:
         assert "callbacks" in call_kwargs
         assert isinstance(call_kwargs["callbacks"], MCPContextProgressCallback)
 
+    async def test_get_person_profile_served_from_cache(self, mock_context):
+        """A repeat request for the same profile skips the extractor."""
+        expected = {
+            "url": "https://www.linkedin.com/in/test-user/",
+            "sections": {"main_profile": "John Doe"},
+        }
+        mock_extractor = _make_mock_extractor(expected)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        tool_fn = await get_tool_fn(mcp, "get_person_profile")
+        first = await tool_fn("test-user", mock_context, extractor=mock_extractor)
+        second = await tool_fn("test-user", mock_context, extractor=mock_extractor)
+
+        assert first == second
+        mock_extractor.scrape_person.assert_awaited_once()
+
+    async def test_get_person_profile_force_refresh_bypasses_cache(self, mock_context):
+        stale = {
+            "url": "https://www.linkedin.com/in/test-user/",
+            "sections": {"main_profile": "Old headline"},
+        }
+        fresh = {
+            "url": "https://www.linkedin.com/in/test-user/",
+            "sections": {"main_profile": "New headline"},
+        }
+        mock_extractor = _make_mock_extractor(stale)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        tool_fn = await get_tool_fn(mcp, "get_person_profile")
+        await tool_fn("test-user", mock_context, extractor=mock_extractor)
+        mock_extractor.scrape_person.return_value = fresh
+        refreshed = await tool_fn(
+            "test-user", mock_context, force_refresh=True, extractor=mock_extractor
+        )
+        cached = await tool_fn("test-user", mock_context, extractor=mock_extractor)
+
+        assert refreshed == fresh
+        assert cached == fresh
+        assert mock_extractor.scrape_person.await_count == 2
+
+    async def test_get_person_profile_rate_limited_section_not_cached(
+        self, mock_context
+    ):
+        """A section still rate-limited after retry keeps the result uncached."""
+        from linkedin_mcp_server.scraping.extractor import LinkedInExtractor
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        extractor = LinkedInExtractor(MagicMock())
+        extract_page = AsyncMock(
+            side_effect=lambda url, **_kwargs: ExtractedSection(
+                text=_RATE_LIMITED_MSG if "/details/" in url else "Alice",
+                references=[],
+            )
+        )
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+        tool_fn = await get_tool_fn(mcp, "get_person_profile")
+
+        with (
+            patch.object(extractor, "extract_page", extract_page),
+            patch.object(
+                extractor, "_extract_profile_urn", AsyncMock(return_value=None)
+            ),
+            patch(
+                "linkedin_mcp_server.scraping.extractor.asyncio.sleep",
+                new_callable=AsyncMock,
+            ),
+        ):
+            first = await tool_fn(
+                "alice", mock_context, sections="experience", extractor=extractor
+            )
+            await tool_fn(
+                "alice", mock_context, sections="experience", extractor=extractor
+            )
+
+        assert first["sections"] == {"main_profile": "Alice"}
+        assert first["rate_limited"] == ["experience"]
+        assert extract_page.await_count == 4
+
+    async def test_get_person_profile_partial_result_not_cached(self, mock_context):
+        expected = {
+            "url": "https://www.linkedin.com/in/test-user/",
+            "sections": {"main_profile": "John Doe"},
+            "section_errors": {"posts": "timeout"},
+        }
+        mock_extractor = _make_mock_extractor(expected)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        tool_fn = await get_tool_fn(mcp, "get_person_profile")
+        await tool_fn("test-user", mock_context, extractor=mock_extractor)
+        await tool_fn("test-user", mock_context, extractor=mock_extractor)
+
+        assert mock_extractor.scrape_person.await_count == 2
+
+    async def test_get_person_profiles_scrapes_only_cache_misses(self, mock_context):
+        """Cached profiles are reused; only misses reach scrape_people."""
+        alice = {
+            "url": "https://www.linkedin.com/in/alice/",
+            "sections": {"main_profile": "Alice"},
+        }
+        bob = {
+            "url": "https://www.linkedin.com/in/bob/",
+            "sections": {"main_profile": "Bob"},
+        }
+        mock_extractor = _make_mock_extractor(alice)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        single_fn = await get_tool_fn(mcp, "get_person_profile")
+        await single_fn("alice", mock_context, extractor=mock_extractor)
+
+        mock_extractor.scrape_person.return_value = bob
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        result = await batch_fn(
+            ["alice", "bob"], mock_context, extractor=mock_extractor
+        )
+
+        assert result["profiles"] == [alice, bob]
+        mock_extractor.scrape_people.assert_awaited_once()
+        assert mock_extractor.scrape_people.call_args.args[0] == ["bob"]
+
+    async def test_get_person_profiles_dedupes_usernames(self, mock_context):
+        """Spellings of the same username are scraped once and fanned out."""
+        expected = {
+            "url": "https://www.linkedin.com/in/alice/",
+            "sections": {"main_profile": "Alice"},
+        }
+        mock_extractor = _make_mock_extractor(expected)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        result = await batch_fn(
+            ["alice", " Alice/"], mock_context, extractor=mock_extractor
+        )
+
+        assert result["profiles"] == [expected, expected]
+        mock_extractor.scrape_people.assert_awaited_once()
+        assert mock_extractor.scrape_people.call_args.args[0] == ["alice"]
+
+    async def test_get_person_profiles_all_cached_skips_extractor(self, mock_context):
+        expected = {
+            "url": "https://www.linkedin.com/in/alice/",
+            "sections": {"main_profile": "Alice"},
+        }
+        mock_extractor = _make_mock_extractor(expected)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        await batch_fn(["alice"], mock_context, extractor=mock_extractor)
+        result = await batch_fn(
+            ["alice"], mock_context, sections="bogus", extractor=mock_extractor
+        )
+
+        assert result["unknown_sections"] == ["bogus"]
+        mock_extractor.scrape_people.assert_awaited_once()
+
+    async def test_get_person_profiles_caches_profiles_before_batch_aborts(
+        self, mock_context
+    ):
+        """Profiles finished before a rate limit are not scraped again on retry."""
+        from fastmcp.exceptions import ToolError
+
+        from linkedin_mcp_server.core.exceptions import RateLimitError
+
+        alice = {
+            "url": "https://www.linkedin.com/in/alice/",
+            "sections": {"main_profile": "Alice"},
+        }
+        mock_extractor = _make_mock_extractor(alice)
+        mock_extractor.scrape_person.side_effect = [
+            alice,
+            RateLimitError("slow down", suggested_wait_time=60),
+        ]
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        with pytest.raises(ToolError):
+            await batch_fn(["alice", "bob"], mock_context, extractor=mock_extractor)
+
+        mock_extractor.scrape_person.side_effect = None
+        result = await batch_fn(["alice"], mock_context, extractor=mock_extractor)
+
+        assert result["profiles"] == [alice]
+        assert mock_extractor.scrape_person.await_count == 2
+
+    async def test_get_person_profiles_reports_progress_per_profile(self, mock_context):
+        mock_extractor = _make_mock_extractor(
+            {"url": "https://www.linkedin.com/in/x/", "sections": {"main_profile": "X"}}
+        )
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        await batch_fn(["alice", "bob"], mock_context, extractor=mock_extractor)
+
+        calls = [c.kwargs for c in mock_context.report_progress.call_args_list]
+        assert calls == [
+            {"progress": 0, "total": 2, "message": "Scraping profiles"},
+            {"progress": 1, "total": 2, "message": "Scraped alice"},
+            {"progress": 2, "total": 2, "message": "Scraped bob"},
+        ]
+
+    async def test_get_person_profiles_force_refresh(self, mock_context):
+        expected = {
+            "url": "https://www.linkedin.com/in/alice/",
+            "sections": {"main_profile": "Alice"},
+        }
+        mock_extractor = _make_mock_extractor(expected)
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        await batch_fn(["alice"], mock_context, extractor=mock_extractor)
+        await batch_fn(
+            ["alice"], mock_context, force_refresh=True, extractor=mock_extractor
+        )
+
+        assert mock_extractor.scrape_person.await_count == 2
+
+    async def test_get_person_profiles_rejects_batches_over_page_budget(
+        self, mock_context
+    ):
+        """The cap counts page visits, so extra sections shrink the batch."""
+        from fastmcp.exceptions import ToolError
+
+        mock_extractor = _make_mock_extractor({})
+
+        from linkedin_mcp_server.tools.person import register_person_tools
+
+        mcp = FastMCP("test")
+        register_person_tools(mcp)
+
+        batch_fn = await get_tool_fn(mcp, "get_person_profiles")
+        with pytest.raises(ToolError, match="15 pages"):
+            await batch_fn(
+                ["a", "b", "c", "d", "e"],
+                mock_context,
+                sections="experience,education",
+                extractor=mock_extractor,
+            )
+
+        mock_extractor.scrape_people.assert_not_awaited()
+
     async def test_get_person_profile_passes_max_scrolls(self, mock_context):
         """Verify max_scrolls parameter is forwarded to scrape_person."""
         expected = {
@@ -748,6 +1038,7 @@ class TestToolTimeouts:
 
         tool_names = (
             "get_person_profile",
+            "get_person_profiles",
             "connect_with_person",
             "get_sidebar_profiles",
             "search_people",
@@ -760,6 +1051,7 @@ class TestToolTimeouts:
             "search_conversations",
             "send_message",
             "close_session",
+            "clear_scrape_cache",
         )
 
         for name in tool_names: